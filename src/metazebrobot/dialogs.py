@@ -0,0 +1,189 @@
+from datetime import datetime
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
+                             QComboBox, QDateEdit, QLineEdit, QPushButton,
+                             QCheckBox, QSpinBox)
+from PySide6.QtCore import QDate
+
+def _now_stamp():
+    """Current local time as YYYYMMDDhh:mm:ss, the quality check time format"""
+    n = datetime.now()
+    return f"{n.year:04d}{n.month:02d}{n.day:02d}{n.hour:02d}:{n.minute:02d}:{n.second:02d}"
+
+class TerminationDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Update Dish Status")
+        self.setMinimumWidth(400)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        form_layout = QFormLayout()
+
+        # Status selection
+        self.status = QComboBox()
+        self.status.addItems(["active", "inactive"])
+        form_layout.addRow("Status:", self.status)
+
+        # Termination date (only enabled if status is inactive)
+        self.termination_date = QDateEdit()
+        self.termination_date.setDate(QDate.currentDate())
+        self.termination_date.setCalendarPopup(True)
+        self.termination_date.setEnabled(False)
+        form_layout.addRow("Termination Date:", self.termination_date)
+
+        # Termination reason (only enabled if status is inactive)
+        self.termination_reason = QLineEdit()
+        self.termination_reason.setPlaceholderText("Enter reason for termination...")
+        self.termination_reason.setEnabled(False)
+        form_layout.addRow("Termination Reason:", self.termination_reason)
+
+        # Connect status change to enable/disable termination fields
+        self.status.currentTextChanged.connect(self.handle_status_change)
+
+        layout.addLayout(form_layout)
+
+        # Buttons
+        button_box = QHBoxLayout()
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self.accept)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+
+        button_box.addWidget(save_button)
+        button_box.addWidget(cancel_button)
+        layout.addLayout(button_box)
+
+    def handle_status_change(self, status):
+        """Enable or disable termination fields based on status"""
+        is_inactive = status == "inactive"
+        self.termination_date.setEnabled(is_inactive)
+        self.termination_reason.setEnabled(is_inactive)
+
+    def get_data(self):
+        """Return the dialog data"""
+        status = self.status.currentText()
+        return {
+            "status": status,
+            "termination_date": self.termination_date.date().toString("yyyyMMdd") if status == "inactive" else None,
+            "termination_reason": self.termination_reason.text() if status == "inactive" else None
+        }
+
+class QualityCheckDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Quality Check Entry")
+        # Set a fixed size for the dialog
+        self.setMinimumWidth(400)
+        self.setMinimumHeight(500)
+        self.setup_ui()
+    
+    def set_current_time(self):
+        """Set the check time to current time"""
+        self.check_time.setText(_now_stamp())
+
+    def handle_save(self):
+        """Handle save button click without closing the dialog"""
+        # Emit the accepted signal but don't close
+        self.accepted.emit()
+        # Clear fields after saving
+        self.clear_fields()
+        
+    def clear_fields(self):
+        """Clear all input fields"""
+        self.set_current_time()  # Reset to current time
+        self.fed.setChecked(False)
+        self.feed_type.clear()
+        self.water_changed.setChecked(False)
+        self.vol_water_changed.setValue(0)
+        self.num_dead.setValue(0)
+        self.notes.clear()
+        
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        form_layout = QFormLayout()
+        
+        # Set wider spacing
+        layout.setSpacing(10)
+        form_layout.setSpacing(10)
+        
+        # Check time (auto-filled with current time)
+        self.check_time = QLineEdit()
+        self.check_time.setText(_now_stamp())
+        self.check_time.setPlaceholderText("YYYYMMDDhh:mm:ss")  # Show format
+        self.check_time.setReadOnly(False)  # Make it editable
+        form_layout.addRow("Check Time:", self.check_time)
+
+        # Add a "Now" button to quickly set current time
+        now_button = QPushButton("Set Current Time")
+        now_button.clicked.connect(self.set_current_time)
+        form_layout.addRow("", now_button)  # Add in new row
+        
+        # Feeding information
+        self.fed = QCheckBox()
+        form_layout.addRow("Fed:", self.fed)
+        
+        self.feed_type = QLineEdit()
+        self.feed_type.setEnabled(False)  # Initially disabled
+        self.feed_type.setPlaceholderText("e.g., paramecia, dry food")
+        form_layout.addRow("Feed Type:", self.feed_type)
+        
+        # Connect fed checkbox to enable/disable feed type
+        self.fed.stateChanged.connect(self._on_fed_toggled)
+        
+        # Water change information
+        self.water_changed = QCheckBox()
+        form_layout.addRow("Water Changed:", self.water_changed)
+        
+        self.vol_water_changed = QSpinBox()
+        self.vol_water_changed.setRange(0, 1000)
+        self.vol_water_changed.setSuffix(" mL")
+        self.vol_water_changed.setEnabled(False)  # Initially disabled
+        form_layout.addRow("Volume Changed:", self.vol_water_changed)
+        
+        # Connect water changed checkbox to enable/disable volume
+        self.water_changed.stateChanged.connect(self._on_water_changed_toggled)
+        
+        # Health information
+        self.num_dead = QSpinBox()
+        self.num_dead.setRange(0, 100)
+        form_layout.addRow("Number Dead:", self.num_dead)
+        
+        # Notes field
+        self.notes = QLineEdit()
+        self.notes.setPlaceholderText("Any additional observations...")
+        form_layout.addRow("Notes:", self.notes)
+        
+        # Add form to main layout
+        layout.addLayout(form_layout)
+        
+        # Add buttons
+        button_layout = QHBoxLayout()
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self.handle_save)  # Changed to custom handler
+        
+        button_layout.addWidget(save_button)
+        layout.addLayout(button_layout)
+        
+    def _on_fed_toggled(self, state):
+        """Only ask for a feed type when the fish were fed"""
+        self.feed_type.setEnabled(bool(state))
+        
+    def _on_water_changed_toggled(self, state):
+        """Only ask for a volume when the water was changed"""
+        self.vol_water_changed.setEnabled(bool(state))
+        
+    def get_data(self):
+        """Return the quality check data as a dictionary"""
+        # Read each widget once
+        fed = self.fed.isChecked()
+        water_changed = self.water_changed.isChecked()
+        return {
+            "check_time": self.check_time.text(),
+            "fed": fed,
+            "feed_type": self.feed_type.text() if fed else None,
+            "water_changed": water_changed,
+            "vol_water_changed": self.vol_water_changed.value() if water_changed else None,
+            "num_dead": self.num_dead.value(),
+            "notes": self.notes.text() or None
+        }
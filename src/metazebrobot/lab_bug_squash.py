@@ -1,14 +1,27 @@
 import sys
+import math
+import time
 import random
+from collections import deque
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QPushButton, QLabel, QGridLayout)
-from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QFont, QPixmap, QIcon, QColor, QPainter
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont
 
 class BugSquashGame(QMainWindow):
     """
     Claude built this 'for fun' after helping me with something. Pretty neato.
     """
+    # Cell stylesheets, built once rather than on every spawn and click
+    STYLE_EMPTY = "background-color: transparent; border: none;"
+    STYLE_SQUASHED = "background-color: #e1ffd6; border: none;"  # Green flash for success
+    STYLE_MISSED = "background-color: #ffe1e1; border: none;"  # Red flash for miss
+    STYLE_BY_TYPE = {
+        'bacteria': "background-color: #d3f0ea; border-radius: 10px;",
+        'fungus': "background-color: #f5e5b7; border-radius: 10px;",
+        'virus': "background-color: #f7c1c1; border-radius: 10px;"
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Lab Bug Squash")
@@ -16,20 +29,40 @@ class BugSquashGame(QMainWindow):
         
         # Game state
         self.score = 0
-        self.time_left = 30  # 30 seconds game
+        self.game_length = 30  # 30 seconds game
+        self.time_left = self.game_length
+        self._end_time = 0.0  # time.monotonic() at which the current game ends
         self.game_active = False
-        self.bugs = {}  # To track active bugs {button_id: bug_type}
-        self.bug_timer = QTimer()
-        self.bug_timer.timeout.connect(self.spawn_bug)
-        self.game_timer = QTimer()
-        self.game_timer.timeout.connect(self.update_timer)
-        
-        # Bug types and their point values
-        self.bug_types = {
-            'bacteria': 10,   # Common, worth fewer points
-            'fungus': 20,     # Less common, worth more
-            'virus': 30       # Rare, worth the most
-        }
+        # Active bugs as one byte per cell, indexed by row * 5 + col: 0 for no
+        # bug, otherwise the bug's id (see bug types below)
+        self._grid = bytearray(25)
+        self._free_mask = 0  # Bit row * 5 + col is set while that cell has no bug
+        
+        # Everything in a game runs off one 0.1 second tick: new bugs spawn
+        # every spawn_interval seconds and disappear after bug_lifetime seconds
+        # if not clicked, with expiries queued in spawn order rather than a
+        # singleShot timer per bug. The game clock counts down from a fixed end
+        # time so it doesn't drift.
+        self.spawn_interval = 1.2
+        self._next_spawn = 0.0  # time.monotonic() of the next spawn
+        self.bug_lifetime = 2.0
+        self._bug_expiries = deque()  # (deadline, row, col) in spawn order
+        self._bug_deadlines = [None] * 25  # Deadline of the bug in each cell, by grid index
+        self.tick_timer = QTimer()
+        self.tick_timer.timeout.connect(self.tick)
+        
+        # Squash/miss flashes are cleared by the same timer after this long
+        self.flash_duration = 0.2
+        self._flash_resets = deque()  # (deadline, row, col) in click order
+        
+        # Bug types and their point values, indexed by bug id (0 is no bug).
+        # Bacteria are common and worth fewer points, viruses rare and worth the most
+        self._bug_names = (None, 'bacteria', 'fungus', 'virus')
+        self._bug_points = (0, 10, 20, 30)
+        
+        # Bug rarity as cumulative weights: 60% bacteria, 30% fungus, 10% virus
+        self._bug_ids = (1, 2, 3)
+        self._bug_cum_weights = (0.6, 0.9, 1.0)
         
         # Penalties for missing (clicking empty)
         self.penalty = -5
@@ -45,38 +78,38 @@ class BugSquashGame(QMainWindow):
         
         # Info panel
         info_panel = QHBoxLayout()
+        info_font = QFont("Arial", 16, QFont.Bold)
         
         # Score display
         self.score_label = QLabel("Score: 0")
-        self.score_label.setFont(QFont("Arial", 16, QFont.Bold))
+        self.score_label.setFont(info_font)
         info_panel.addWidget(self.score_label)
         
         # Timer display
         self.timer_label = QLabel("Time: 30s")
-        self.timer_label.setFont(QFont("Arial", 16, QFont.Bold))
+        self.timer_label.setFont(info_font)
         info_panel.addWidget(self.timer_label)
         
         main_layout.addLayout(info_panel)
         
         # Game grid - where the bugs will appear
-        game_widget = QWidget()
+        self.game_widget = game_widget = QWidget()
         game_widget.setStyleSheet("background-color: #f0f8ff;")  # Light blue like a clean lab surface
+        game_widget.setEnabled(False)  # Disabled until game starts
         game_layout = QGridLayout(game_widget)
         game_layout.setSpacing(5)
         
         # Create a 5x5 grid of buttons where bugs can appear
-        self.buttons = []
+        self.button_map = {}  # {(row, col): button}
         for row in range(5):
             for col in range(5):
                 button = QPushButton()
                 button.setFixedSize(100, 70)
-                button.setIcon(QIcon())  # Empty icon initially
-                button.setIconSize(QSize(60, 60))
-                button.setStyleSheet("background-color: transparent; border: none;")
-                button.clicked.connect(lambda checked, r=row, c=col: self.squash_bug(r, c))
-                button.setEnabled(False)  # Disabled until game starts
+                button.setStyleSheet(self.STYLE_EMPTY)
+                button.setProperty("cell", (row, col))
+                button.clicked.connect(self.cell_clicked)
                 game_layout.addWidget(button, row, col)
-                self.buttons.append((row, col, button))
+                self.button_map[(row, col)] = button
         
         main_layout.addWidget(game_widget)
         
@@ -100,28 +133,46 @@ class BugSquashGame(QMainWindow):
     def start_game(self):
         # Reset game state
         self.score = 0
-        self.time_left = 30
-        self.bugs = {}
+        self.time_left = self.game_length
+        now = time.monotonic()
+        self._end_time = now + self.game_length
+        self._next_spawn = now + self.spawn_interval
+        self._time_labels = [f"Time: {i}s" for i in range(self.game_length + 1)]
+        self._grid = bytearray(25)
+        self._free_mask = (1 << 25) - 1
+        self._bug_expiries.clear()
+        self._flash_resets.clear()
+        self._bug_deadlines = [None] * 25
         self.game_active = True
         
         # Update UI
         self.score_label.setText("Score: 0")
-        self.timer_label.setText("Time: 30s")
+        self.timer_label.setText(self._time_labels[self.time_left])
         self.start_button.setEnabled(False)
         self.start_button.setText("Game In Progress")
         
         # Enable all buttons
-        for row, col, button in self.buttons:
-            button.setEnabled(True)
-            button.setIcon(QIcon())  # Clear any icons
+        self.game_widget.setEnabled(True)
         
-        # Start timers
-        self.bug_timer.start(1200)  # New bug every 1.2 seconds
-        self.game_timer.start(1000)  # Update timer every second
+        # Start the game tick
+        self.tick_timer.start(100)  # Spawn and expire bugs, clear flashes and update the clock
+    
+    def tick(self):
+        now = time.monotonic()
+        if now >= self._next_spawn:
+            self._next_spawn += self.spawn_interval
+            self.spawn_bug()
+        self.remove_expired_bugs(now)
+        self.reset_flashes(now)
+        self.update_timer(now)
     
-    def update_timer(self):
-        self.time_left -= 1
-        self.timer_label.setText(f"Time: {self.time_left}s")
+    def update_timer(self, now):
+        # Only touch the label when the displayed second changes
+        time_left = max(0, math.ceil(self._end_time - now))
+        if time_left == self.time_left:
+            return
+        self.time_left = time_left
+        self.timer_label.setText(self._time_labels[time_left])
         
         if self.time_left <= 0:
             self.end_game()
@@ -129,13 +180,14 @@ class BugSquashGame(QMainWindow):
     def end_game(self):
         # Stop the game
         self.game_active = False
-        self.bug_timer.stop()
-        self.game_timer.stop()
+        self.tick_timer.stop()
         
-        # Disable all buttons
-        for row, col, button in self.buttons:
-            button.setEnabled(False)
-            button.setIcon(QIcon())  # Clear any icons
+        # Disable all buttons and clear any bugs or flashes still on the board
+        self.game_widget.setEnabled(False)
+        for index, bug_id in enumerate(self._grid):
+            if bug_id:
+                self.remove_bug(*divmod(index, 5))
+        self.reset_flashes(math.inf)
         
         # Reset start button
         self.start_button.setEnabled(True)
@@ -145,76 +197,93 @@ class BugSquashGame(QMainWindow):
         if not self.game_active:
             return
         
-        # Randomly choose a location
-        available_buttons = [(r, c, b) for r, c, b in self.buttons if (r, c) not in self.bugs]
-        if not available_buttons:
+        # Randomly choose a location: skip a random number of free cells by
+        # clearing the lowest set bits, then take the next one
+        free_mask = self._free_mask
+        if not free_mask:
             return  # No space available
         
-        row, col, button = random.choice(available_buttons)
+        for _ in range(random.randrange(free_mask.bit_count())):
+            free_mask &= free_mask - 1
+        index = (free_mask & -free_mask).bit_length() - 1
+        self._free_mask &= ~(1 << index)
+        row, col = divmod(index, 5)
+        button = self.button_map[(row, col)]
         
         # Choose bug type based on rarity
-        bug_roll = random.random()
-        if bug_roll < 0.6:  # 60% chance for bacteria
-            bug_type = 'bacteria'
-            button.setStyleSheet("background-color: #d3f0ea; border-radius: 10px;")
-        elif bug_roll < 0.9:  # 30% chance for fungus
-            bug_type = 'fungus'
-            button.setStyleSheet("background-color: #f5e5b7; border-radius: 10px;")
-        else:  # 10% chance for virus
-            bug_type = 'virus'
-            button.setStyleSheet("background-color: #f7c1c1; border-radius: 10px;")
+        bug_id = random.choices(self._bug_ids, cum_weights=self._bug_cum_weights)[0]
+        button.setStyleSheet(self.STYLE_BY_TYPE[self._bug_names[bug_id]])
         
         # Store the bug
-        self.bugs[(row, col)] = bug_type
+        self._grid[index] = bug_id
         
-        # Set a timer to make the bug disappear if not clicked
-        QTimer.singleShot(2000, lambda r=row, c=col: self.remove_bug(r, c))
+        # Queue the bug to disappear if not clicked
+        deadline = time.monotonic() + self.bug_lifetime
+        self._bug_expiries.append((deadline, row, col))
+        self._bug_deadlines[index] = deadline
+    
+    def remove_expired_bugs(self, now):
+        expiries = self._bug_expiries
+        while expiries and expiries[0][0] <= now:
+            deadline, row, col = expiries.popleft()
+            # Skip bugs that were already squashed, even if a newer bug has
+            # since spawned in the same cell
+            if self._bug_deadlines[row * 5 + col] == deadline:
+                self.remove_bug(row, col)
+    
+    def reset_flashes(self, now):
+        flashes = self._flash_resets
+        while flashes and flashes[0][0] <= now:
+            deadline, row, col = flashes.popleft()
+            # Don't hide a bug that spawned in the cell during the flash
+            if not self._grid[row * 5 + col]:
+                self.button_map[(row, col)].setStyleSheet(self.STYLE_EMPTY)
     
     def remove_bug(self, row, col):
-        if (row, col) in self.bugs:
-            del self.bugs[(row, col)]
-            
-            # Find the button for this position
-            for r, c, button in self.buttons:
-                if r == row and c == col:
-                    button.setStyleSheet("background-color: transparent; border: none;")
-                    break
+        index = row * 5 + col
+        if self._grid[index]:
+            self._grid[index] = 0
+            self._bug_deadlines[index] = None
+            self._free_mask |= 1 << index
+            self.button_map[(row, col)].setStyleSheet(self.STYLE_EMPTY)
+    
+    def cell_clicked(self):
+        # All grid buttons share this slot; each carries its own cell
+        row, col = self.sender().property("cell")
+        self.squash_bug(row, col)
     
     def squash_bug(self, row, col):
         if not self.game_active:
             return
             
+        button = self.button_map[(row, col)]
+        
         # Check if there's a bug at this position
-        if (row, col) in self.bugs:
-            bug_type = self.bugs[(row, col)]
-            points = self.bug_types[bug_type]
-            self.score += points
+        bug_id = self._grid[row * 5 + col]
+        if bug_id:
+            self.score += self._bug_points[bug_id]
             
             # Remove the bug
             self.remove_bug(row, col)
             
             # Provide visual feedback for the squash
-            for r, c, button in self.buttons:
-                if r == row and c == col:
-                    button.setStyleSheet("background-color: #e1ffd6; border: none;")  # Green flash for success
-                    QTimer.singleShot(200, lambda b=button: b.setStyleSheet("background-color: transparent; border: none;"))
-                    break
+            button.setStyleSheet(self.STYLE_SQUASHED)
         else:
             # Penalty for missing
             self.score += self.penalty
             
             # Visual feedback for miss
-            for r, c, button in self.buttons:
-                if r == row and c == col:
-                    button.setStyleSheet("background-color: #ffe1e1; border: none;")  # Red flash for miss
-                    QTimer.singleShot(200, lambda b=button: b.setStyleSheet("background-color: transparent; border: none;"))
-                    break
+            button.setStyleSheet(self.STYLE_MISSED)
+        
+        # Queue the flash to be cleared
+        self._flash_resets.append((time.monotonic() + self.flash_duration, row, col))
         
         # Update score display
         self.score_label.setText(f"Score: {self.score}")
 
-def launch_game():
-    app = QApplication(sys.argv)
+def launch_game(argv=None):
+    # Qt only needs the real command line when launched as a script
+    app = QApplication(sys.argv if argv is None else argv)
     game = BugSquashGame()
     game.show()
     sys.exit(app.exec())
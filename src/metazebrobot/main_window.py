@@ -1,232 +1,467 @@
+import os
+import re
 import sys
-import json
-from datetime import datetime
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from pydantic_core import from_json, to_json
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTabWidget, QLabel, QPushButton, 
                              QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox,
-                             QTableWidget, QTableWidgetItem, QMessageBox, QFrame,
+                             QTableView, QHeaderView, QMessageBox, QFrame,
                              QScrollArea, QGridLayout, QGroupBox, QDateEdit, QCheckBox,
-                             QFormLayout, QDialog, QSystemTrayIcon, QMenu, QHeaderView,
-                             QMenuBar)
-from PySide6.QtCore import Qt, QDate
+                             QDialog, QSystemTrayIcon, QMenu)
+from PySide6.QtCore import Qt, QDate, QTimer, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QAction
+from .dialogs import TerminationDialog, QualityCheckDialog
+from .table_models import TextTableModel
 
-def main():
+log = logging.getLogger(__name__)
+
+# Material category -> (file name in the material data directory, key the
+# items are stored under within that file)
+MATERIAL_FILES = {
+    'agarose_bottles': ('agarose_bottles.json', 'agarose_bottles'),
+    'agarose_solutions': ('agarose_solutions.json', 'agarose_solutions'),
+    'fish_water_sources': ('fish_water_sources.json', 'fish_water_batches'),
+    'fish_water_derivatives': ('fish_water_derivatives.json', 'fish_water_derivatives'),
+    'poly_l_serine_bottles': ('poly-l-serine_bottles.json', 'poly_l_serine_bottles'),
+    'poly_l_serine_derivatives': ('poly-l-serine_derivatives.json', 'poly_l_serine_derivatives')
+}
+
+# Every top-level category in self.data: the material categories plus the
+# fish dishes, which are stored one file per dish
+DATA_CATEGORIES = (*MATERIAL_FILES, 'fish_dishes')
+
+def _empty_data():
+    """Fresh data with every category present and empty"""
+    return {key: {} for key in DATA_CATEGORIES}
+
+# Local cache of parsed dish files, so startup only re-reads changed dishes
+DISH_CACHE_DIR = Path.home() / ".cache" / "metazebrobot"
+# Bump when the cache file's layout changes; caches with another version are ignored
+DISH_CACHE_VERSION = 2
+
+# Dish files are named {dish_id}_{dof}.json
+_DISH_FILE_RE = re.compile(r'^(?P<dish_id>.+)_(?P<dof>[^_]+)\.json$')
+
+def _format_number(value):
+    """Format floats to six significant digits, hiding float noise without dropping stored digits
+    
+    The rounded value is written out in full, never in exponent notation.
+    """
+    if isinstance(value, float):
+        return format(Decimal(f"{value:.6g}"), 'f')
+    return str(value)
+
+# Material table columns after the item ID: (key path into the item, formatter)
+_SOLUTION_COLUMNS = (
+    (('date_prepared',), str),
+    (('concentration',), _format_number),
+    (('volume_prepared_mL',), _format_number),
+    (('fish_water_batch_id',), str),
+    (('storage', 'location'), str),
+    (('storage', 'expiration'), str)
+)
+_FW_COLUMNS = (
+    (('source_batch_id',), str),
+    (('date_prepared',), str),
+    (('volume_prepared_mL',), _format_number),
+    (('storage', 'location'), str)
+)
+_PLS_COLUMNS = (
+    (('source_bottle_id',), str),
+    (('date_prepared',), str),
+    (('volume_prepared',), _format_number),
+    (('storage', 'location'), str)
+)
+
+def _get_path(item, keys):
+    """The value at a key path into nested dicts, or None if any level is missing or not a dict"""
+    value = item
+    for key in keys:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+def _table_rows(items, columns):
+    """Table rows of text for a dict of items: the item ID, then one value per column"""
+    rows = []
+    for item_id, item in items.items():
+        row = [item_id]
+        for keys, fmt in columns:
+            value = _get_path(item, keys)
+            row.append('' if value is None else fmt(value))
+        rows.append(row)
+    return rows
+
+def _dish_field(dish_data, *keys):
+    """A dish field at a key path, falling back to the old structure that kept it under metadata
+    
+    Missing or null values, including a non-dict level in a malformed file,
+    give ''.
+    """
+    value = _get_path(dish_data, keys)
+    if value is None:
+        value = _get_path(dish_data, ('metadata', *keys))
+    return '' if value is None else value
+
+def _dish_value(dish_data, key):
+    """A top-level dish field, or '' if it is missing or null"""
+    value = _get_path(dish_data, (key,))
+    return '' if value is None else value
+
+# Dish table columns after the dish ID, one getter per column
+_DISH_COLUMN_GETTERS = (
+    lambda dish_data: _dish_value(dish_data, 'date_created'),
+    lambda dish_data: _dish_field(dish_data, 'genotype'),
+    lambda dish_data: _dish_field(dish_data, 'responsible'),
+    # Status is the same in both structures
+    lambda dish_data: _dish_value(dish_data, 'status'),
+    lambda dish_data: _dish_field(dish_data, 'enclosure', 'room')
+)
+
+def _read_json(path):
+    """Read and parse a JSON file in a single read"""
+    return from_json(Path(path).read_bytes())
+
+def _write_json(path, data, indent=2):
+    """Serialize data as JSON, indented unless indent is None, and write it in a single write"""
+    Path(path).write_bytes(to_json(data, indent=indent))
+
+def _replace_json(path, data, indent=2):
+    """Write JSON to a temporary file next to path, then rename it over path
+    
+    Readers, and the file after a crash, only ever see the old or the new
+    contents, never a partial write.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    _write_json(tmp_path, data, indent)
+    os.replace(tmp_path, path)
+
+def _dish_id_sort_key(dish_id):
+    """Sort key for dish IDs so that e.g. 14781_2 sorts before 14781_10"""
+    parts = dish_id.split('_')
+    if len(parts) == 2:
+        main_id, sub_id = parts
+        try:
+            # Try to convert sub_id to integer for numeric sorting
+            return (main_id, int(sub_id))
+        except ValueError:
+            # If sub_id is not numeric, use string sorting
+            return (main_id, sub_id)
+    # Fallback to string sorting
+    return dish_id
+
+def _read_category_file(file_path, file_key):
+    """Read one material file: (its items, the whole file), or ({}, {}) if it doesn't exist"""
     try:
-        print("Starting application...")
-        app = QApplication(sys.argv)
-        print("Created QApplication")
-        
-        print("Creating main window...")
-        window = LabInventoryGUI()
-        print("Created main window")
-        
-        print("Showing window...")
-        window.show()
-        print("Window shown")
+        contents = _read_json(file_path)
+        return contents.get(file_key) or {}, contents
+    except FileNotFoundError:
+        log.warning("File %s not found, using empty dict", file_path.name)
+        return {}, {}
+
+def _scan_dish_files(directory):
+    """List (dish_id, path) for the dish files in directory with a single scandir"""
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                (match['dish_id'], Path(entry.path))
+                for entry in entries
+                if (match := _DISH_FILE_RE.match(entry.name)) and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+def _valid_cache_entries(cached):
+    """The well-formed [mtime_ns, size, dish] entries of a parsed dish cache
+    
+    Anything else, including a cache of another version or one that isn't a
+    dict at all, is treated as a miss so the dish file is read again.
+    """
+    if not isinstance(cached, dict) or cached.get('version') != DISH_CACHE_VERSION:
+        return {}
+    files = cached.get('files')
+    if not isinstance(files, dict):
+        return {}
+    return {
+        name: entry for name, entry in files.items()
+        if isinstance(entry, list) and len(entry) == 3
+        and isinstance(entry[0], int) and isinstance(entry[1], int)
+        and isinstance(entry[2], dict) and 'dish_id' in entry[2]
+    }
+
+def _read_dish_file(dish_file, cached_entry):
+    """Stat a dish file and read its raw bytes, or None if cached_entry is still current"""
+    stat = dish_file.stat()
+    if cached_entry is not None and cached_entry[0] == stat.st_mtime_ns and cached_entry[1] == stat.st_size:
+        return stat, None
+    return stat, dish_file.read_bytes()
+
+def _dish_cache_file(dish_data_dir):
+    """Local cache file for a dish directory"""
+    dir_key = hashlib.sha1(str(Path(dish_data_dir).resolve()).encode()).hexdigest()[:12]
+    return DISH_CACHE_DIR / f"dishes_{dir_key}.json"
+
+def _load_category_files(file_dict, directory):
+    """Load the items of each category in file_dict from a directory
+    
+    Returns ({category: items}, {category: whole file}, {category: error
+    message}); a file that fails to load gives an empty dict for its category.
+    The whole files are kept so that any top-level keys besides the items are
+    written back when the category is saved.
+    """
+    # Read the files concurrently so round trips to the share overlap
+    data = {}
+    contents = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=len(file_dict)) as pool:
+        futures = {}
+        for key, (filename, file_key) in file_dict.items():
+            log.debug("Loading %s...", filename)
+            futures[key] = pool.submit(_read_category_file, directory / filename, file_key)
+            
+        for key, future in futures.items():
+            try:
+                data[key], contents[key] = future.result()
+            except Exception as e:
+                filename = file_dict[key][0]
+                log.error("Error loading %s: %s", filename, e)
+                errors[key] = f"{filename}: {str(e)}"
+                data[key] = {}
+                contents[key] = {}
+                
+    return data, contents, errors
+
+def _load_fish_dishes(dish_data_dir):
+    """Load all fish dishes from a directory
+    
+    Returns (dishes, dish index). Parsed dishes are cached locally keyed on
+    file name, mtime and size, so only files that changed since the last run
+    are read from the (usually remote) dish directory.
+    """
+    if not dish_data_dir:
+        return {}, {}
+        
+    cache_file = _dish_cache_file(dish_data_dir)
+    try:
+        cached = _read_json(cache_file)
+    except Exception:
+        cached = None
+    entries = _valid_cache_entries(cached)
         
-        print("Entering event loop...")
-        sys.exit(app.exec())
+    try:
+        dish_files = [path for _, path in _scan_dish_files(dish_data_dir)]
+    except Exception as e:
+        log.error("Error loading dishes: %s", e)
+        return {}, {}
+        
+    # The dish directory is usually a network share, so stat and read the
+    # files concurrently rather than one round trip at a time
+    raw_files = []
+    if dish_files:
+        with ThreadPoolExecutor(max_workers=min(16, len(dish_files))) as pool:
+            futures = [
+                (dish_file, pool.submit(_read_dish_file, dish_file, entries.get(dish_file.name)))
+                for dish_file in dish_files
+            ]
+            for dish_file, future in futures:
+                try:
+                    raw_files.append((dish_file, *future.result()))
+                except Exception as e:
+                    log.error("Error loading dish file %s: %s", dish_file.name, e)
+                    
+    # Then parse everything that was read in one pass, off the I/O threads
+    dishes = {}
+    fresh = {}
+    index = {}
+    changed = False
+    for dish_file, stat, raw in raw_files:
+        try:
+            if raw is None:
+                dish_data = entries[dish_file.name][2]
+            else:
+                dish_data = from_json(raw)
+                changed = True
+            dish_id = dish_data['dish_id']
+        except Exception as e:
+            log.error("Error loading dish file %s: %s", dish_file.name, e)
+            continue
+        dishes[dish_id] = dish_data
+        fresh[dish_file.name] = [stat.st_mtime_ns, stat.st_size, dish_data]
+        index[dish_id] = (dish_file, stat.st_mtime_ns)
+        
+    # Rewrite the cache if any file was re-read or removed, or it held entries
+    # that couldn't be used
+    cached_files = cached.get('files') if isinstance(cached, dict) else None
+    if changed or not isinstance(cached_files, dict) or fresh.keys() != cached_files.keys():
+        try:
+            DISH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Only this app reads the cache, so it is written compact
+            _replace_json(cache_file, {'version': DISH_CACHE_VERSION, 'files': fresh}, indent=None)
+        except OSError as e:
+            log.warning("Could not write dish cache: %s", e)
+            
+    return dishes, index
+
+def _load_all_data(material_data_dir, dish_data_dir):
+    """Load all material and dish data without touching the UI
+    
+    Returns (data, dish index, {category: whole material file},
+    {category: error message} for the material files that failed to load,
+    success).
+    """
+    data = _empty_data()
+    file_contents = {}
+    errors = {}
+    success = True
+    
+    # Load material files
+    if not material_data_dir:
+        log.warning("No material data directory configured")
+        success = False
+    else:
+        loaded, file_contents, errors = _load_category_files(MATERIAL_FILES, material_data_dir)
+        data.update(loaded)
+        success &= not errors
+        
+    # Load fish dishes
+    try:
+        data['fish_dishes'], dish_index = _load_fish_dishes(dish_data_dir)
     except Exception as e:
-        print(f"Fatal error: {str(e)}")
-        raise
-
-class TerminationDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Update Dish Status")
-        self.setMinimumWidth(400)
-        self.setup_ui()
-
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        form_layout = QFormLayout()
-
-        # Status selection
-        self.status = QComboBox()
-        self.status.addItems(["active", "inactive"])
-        form_layout.addRow("Status:", self.status)
-
-        # Termination date (only enabled if status is inactive)
-        self.termination_date = QDateEdit()
-        self.termination_date.setDate(QDate.currentDate())
-        self.termination_date.setCalendarPopup(True)
-        self.termination_date.setEnabled(False)
-        form_layout.addRow("Termination Date:", self.termination_date)
-
-        # Termination reason (only enabled if status is inactive)
-        self.termination_reason = QLineEdit()
-        self.termination_reason.setPlaceholderText("Enter reason for termination...")
-        self.termination_reason.setEnabled(False)
-        form_layout.addRow("Termination Reason:", self.termination_reason)
-
-        # Connect status change to enable/disable termination fields
-        self.status.currentTextChanged.connect(self.handle_status_change)
+        log.error("Error loading fish dishes: %s", e)
+        data['fish_dishes'], dish_index = {}, {}
+        success = False
+        
+    return data, dish_index, file_contents, errors, success
 
-        layout.addLayout(form_layout)
+@lru_cache(maxsize=1)
+def _day_strings(ordinal):
+    """Format a proleptic Gregorian ordinal, and the same day a year later, as YYYYMMDD"""
+    day = date.fromordinal(ordinal)
+    try:
+        next_year = day.replace(year=day.year + 1)
+    except ValueError:
+        # Feb 29 has no counterpart next year
+        next_year = day.replace(year=day.year + 1, day=28)
+    return (f"{day.year:04d}{day.month:02d}{day.day:02d}",
+            f"{next_year.year:04d}{next_year.month:02d}{next_year.day:02d}")
 
-        # Buttons
-        button_box = QHBoxLayout()
-        save_button = QPushButton("Save")
-        save_button.clicked.connect(self.accept)
-        cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(self.reject)
-
-        button_box.addWidget(save_button)
-        button_box.addWidget(cancel_button)
-        layout.addLayout(button_box)
-
-    def handle_status_change(self, status):
-        """Enable or disable termination fields based on status"""
-        is_inactive = status == "inactive"
-        self.termination_date.setEnabled(is_inactive)
-        self.termination_reason.setEnabled(is_inactive)
-
-    def get_data(self):
-        """Return the dialog data"""
-        status = self.status.currentText()
-        return {
-            "status": status,
-            "termination_date": self.termination_date.date().toString("yyyyMMdd") if status == "inactive" else None,
-            "termination_reason": self.termination_reason.text() if status == "inactive" else None
-        }
+def _today_strings():
+    """Today's date and the date a year from today as YYYYMMDD, formatted only once per day"""
+    return _day_strings(date.today().toordinal())
+
+def _today_str():
+    """Today's date as YYYYMMDD, formatted only once per day"""
+    return _today_strings()[0]
 
-class QualityCheckDialog(QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Quality Check Entry")
-        # Set a fixed size for the dialog
-        self.setMinimumWidth(400)
-        self.setMinimumHeight(500)
-        self.setup_ui()
+@lru_cache(maxsize=1)
+def _simple_icon():
+    """Draw the tray icon, a blue rounded square; drawn once and shared by all windows"""
+    # Create a pixmap
+    pixmap = QPixmap(32, 32)
+    pixmap.fill(Qt.transparent)
     
-    def set_current_time(self):
-        """Set the check time to current time"""
-        current_time = datetime.now().strftime("%Y%m%d%H:%M:%S")
-        self.check_time.setText(current_time)
-
-    def handle_save(self):
-        """Handle save button click without closing the dialog"""
-        # Emit the accepted signal but don't close
-        self.accepted.emit()
-        # Clear fields after saving
-        self.clear_fields()
-        
-    def clear_fields(self):
-        """Clear all input fields"""
-        self.set_current_time()  # Reset to current time
-        self.fed.setChecked(False)
-        self.feed_type.clear()
-        self.water_changed.setChecked(False)
-        self.vol_water_changed.setValue(0)
-        self.num_dead.setValue(0)
-        self.notes.clear()
-        
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        form_layout = QFormLayout()
-        
-        # Set wider spacing
-        layout.setSpacing(10)
-        form_layout.setSpacing(10)
-        
-        # Check time (auto-filled with current time)
-        self.check_time = QLineEdit()
-        current_time = datetime.now().strftime("%Y%m%d%H:%M:%S")
-        self.check_time.setText(current_time)
-        self.check_time.setPlaceholderText("YYYYMMDDhh:mm:ss")  # Show format
-        self.check_time.setReadOnly(False)  # Make it editable
-        form_layout.addRow("Check Time:", self.check_time)
-
-        # Add a "Now" button to quickly set current time
-        now_button = QPushButton("Set Current Time")
-        now_button.clicked.connect(self.set_current_time)
-        form_layout.addRow("", now_button)  # Add in new row
-        
-        # Feeding information
-        self.fed = QCheckBox()
-        form_layout.addRow("Fed:", self.fed)
-        
-        self.feed_type = QLineEdit()
-        self.feed_type.setEnabled(False)  # Initially disabled
-        self.feed_type.setPlaceholderText("e.g., paramecia, dry food")
-        form_layout.addRow("Feed Type:", self.feed_type)
-        
-        # Connect fed checkbox to enable/disable feed type
-        self.fed.stateChanged.connect(lambda state: self.feed_type.setEnabled(bool(state)))
-        
-        # Water change information
-        self.water_changed = QCheckBox()
-        form_layout.addRow("Water Changed:", self.water_changed)
-        
-        self.vol_water_changed = QSpinBox()
-        self.vol_water_changed.setRange(0, 1000)
-        self.vol_water_changed.setSuffix(" mL")
-        self.vol_water_changed.setEnabled(False)  # Initially disabled
-        form_layout.addRow("Volume Changed:", self.vol_water_changed)
-        
-        # Connect water changed checkbox to enable/disable volume
-        self.water_changed.stateChanged.connect(lambda state: self.vol_water_changed.setEnabled(bool(state)))
-        
-        # Health information
-        self.num_dead = QSpinBox()
-        self.num_dead.setRange(0, 100)
-        form_layout.addRow("Number Dead:", self.num_dead)
-        
-        # Notes field
-        self.notes = QLineEdit()
-        self.notes.setPlaceholderText("Any additional observations...")
-        form_layout.addRow("Notes:", self.notes)
-        
-        # Add form to main layout
-        layout.addLayout(form_layout)
-        
-        # Add buttons
-        button_layout = QHBoxLayout()
-        save_button = QPushButton("Save")
-        save_button.clicked.connect(self.handle_save)  # Changed to custom handler
-        
-        button_layout.addWidget(save_button)
-        layout.addLayout(button_layout)
-        
-    def get_data(self):
-        """Return the quality check data as a dictionary"""
-        return {
-            "check_time": self.check_time.text(),
-            "fed": self.fed.isChecked(),
-            "feed_type": self.feed_type.text() if self.fed.isChecked() else None,
-            "water_changed": self.water_changed.isChecked(),
-            "vol_water_changed": self.vol_water_changed.value() if self.water_changed.isChecked() else None,
-            "num_dead": self.num_dead.value(),
-            "notes": self.notes.text() if self.notes.text() else None
-        }
+    # Create a painter
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    
+    # Draw a colored square with rounded corners
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(41, 128, 185))  # Nice blue color
+    painter.drawRoundedRect(0, 0, 32, 32, 8, 8)
+    
+    # End painting
+    painter.end()
+    
+    return QIcon(pixmap)
+
+class _LoadWorker(QRunnable):
+    """Loads all data files on a QThreadPool thread and emits the result through a signal"""
+    def __init__(self, material_data_dir, dish_data_dir, finished):
+        super().__init__()
+        self.material_data_dir = material_data_dir
+        self.dish_data_dir = dish_data_dir
+        self.finished = finished
+
+    def run(self):
+        # The signal belongs to the main window, so the result is delivered
+        # on the UI thread
+        self.finished.emit(_load_all_data(self.material_data_dir, self.dish_data_dir))
 
 class LabInventoryGUI(QMainWindow):
+    # Emitted with the result of _load_all_data
+    data_loaded = Signal(object)
+    # Emitted with a category name after its data changes; the views showing
+    # it are refreshed once control returns to the event loop
+    data_changed = Signal(str)
+    
+    # Category -> view update methods that show its data
+    CATEGORY_VIEWS = {
+        'agarose_solutions': ('update_solutions_table',),
+        'fish_water_sources': ('update_fw_sources', 'update_fw_batches'),
+        'fish_water_derivatives': ('update_fw_table',),
+        'poly_l_serine_bottles': ('update_pls_bottles',),
+        'poly_l_serine_derivatives': ('update_pls_table',),
+        'fish_dishes': ('update_dishes_table',)
+    }
+    
     def __init__(self):
-        print("Initializing LabInventoryGUI...")
+        log.debug("Initializing LabInventoryGUI...")
         super().__init__()
         
-        # Initialize data structures with proper nested structure
-        self.data = {
-            'agarose_bottles': {'agarose_bottles': {}},
-            'agarose_solutions': {'agarose_solutions': {}},
-            'fish_water_sources': {'fish_water_batches': {}},
-            'fish_water_derivatives': {'fish_water_derivatives': {}},
-            'poly_l_serine_bottles': {'poly_l_serine_bottles': {}},
-            'poly_l_serine_derivatives': {'poly_l_serine_derivatives': {}}
-        }
+        # Initialize data structures: category -> {item ID: item}
+        self.data = _empty_data()
         self.data_dir = None
         
+        # Sorted/filtered dish rows, keyed on (show_inactive, sort column, sort order)
+        self._dish_rows_cache = {}
+        # Table column values per dish ID
+        self._dish_values_cache = {}
+        
+        # Material categories whose file failed to load; save_data won't write them
+        self._failed_categories = set()
+        # Category -> its material file as last loaded, for the top-level keys
+        # other than the items that have to be written back
+        self._material_file_contents = {}
+        
+        # Base item ID -> numeric suffix _unique_item_id handed out last
+        self._id_counters = {}
+        
+        # Categories changed since the views were last refreshed
+        self._dirty_categories = set()
+        self.data_changed.connect(self.mark_category_dirty)
+        
+        # dish_id -> (file path, mtime_ns as last read or written by this session,
+        # or None if the file has only been listed)
+        self._dish_index = {}
+        
+        # Dish updates waiting to be written, coalesced per dish ID
+        self._pending_dish_writes = {}
+        self._dish_write_timer = QTimer(self)
+        self._dish_write_timer.setSingleShot(True)
+        self._dish_write_timer.setInterval(500)
+        self._dish_write_timer.timeout.connect(self.flush_pending_writes)
+        QApplication.instance().aboutToQuit.connect(self.flush_pending_writes)
+        
+        # The minimized-to-tray notice is only shown the first time per session
+        self._tray_notified = False
+        
         # Create system tray icon
         self.setup_system_tray()
         
         try:
-            print("Starting UI initialization...")
+            log.debug("Starting UI initialization...")
             self.init_ui()
-            print("UI initialization complete")
+            log.debug("UI initialization complete")
         except Exception as e:
-            print(f"Error in init_ui: {str(e)}")
+            log.error("Error in init_ui: %s", e)
             QMessageBox.critical(self, "Initialization Error", f"Error initializing UI: {str(e)}")
             raise
 
@@ -263,7 +498,7 @@ class LabInventoryGUI(QMainWindow):
     # Add this method to your LabInventoryGUI class
     def launch_game(self):
         """Launch the bug squash game"""
-        from lab_bug_squash import BugSquashGame
+        from .lab_bug_squash import BugSquashGame
         self.game = BugSquashGame()
         self.game.show()
 
@@ -320,23 +555,7 @@ class LabInventoryGUI(QMainWindow):
 
     def create_simple_icon(self):
         """Create a simple colored square icon if no icon file is available"""
-        # Create a pixmap
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.transparent)
-        
-        # Create a painter
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw a colored square with rounded corners
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(41, 128, 185))  # Nice blue color
-        painter.drawRoundedRect(0, 0, 32, 32, 8, 8)
-        
-        # End painting
-        painter.end()
-        
-        return QIcon(pixmap)
+        return _simple_icon()
 
     def tray_icon_activated(self, reason):
         """Handle tray icon activation"""
@@ -352,19 +571,21 @@ class LabInventoryGUI(QMainWindow):
         """Override close event to minimize to tray instead of closing"""
         if self.tray_icon.isVisible():
             self.hide()
-            self.tray_icon.showMessage(
-                "Lab Inventory",
-                "Application minimized to tray",
-                QSystemTrayIcon.Information,
-                2000
-            )
+            if not self._tray_notified:
+                self.tray_icon.showMessage(
+                    "Lab Inventory",
+                    "Application minimized to tray",
+                    QSystemTrayIcon.Information,
+                    2000
+                )
+                self._tray_notified = True
             event.ignore()
         else:
             event.accept()
             
     def init_ui(self):
         """Initialize the user interface"""
-        print("Setting window properties...")
+        log.debug("Setting window properties...")
         self.setWindowTitle("Lab Inventory Management System")
         self.setGeometry(100, 100, 1200, 800)
         
@@ -372,77 +593,67 @@ class LabInventoryGUI(QMainWindow):
         self.setup_menu_bar()
 
         # Load config first
-        print("Loading config...")
+        log.debug("Loading config...")
         if not self.load_config():
-            print("Config loading failed")
+            log.warning("Config loading failed")
             return
-        print("Config loaded successfully")
+        log.debug("Config loaded successfully")
             
-        # Then try to load data
-        print("Loading data...")
-        if not self.load_data():
-            print("Data loading failed, using empty datasets")
-            # Continue with empty data if load fails
-            self.data = {
-                'agarose_bottles': {'agarose_bottles': {}},
-                'agarose_solutions': {'agarose_solutions': {}},
-                'fish_water_sources': {'fish_water_batches': {}},
-                'fish_water_derivatives': {'fish_water_derivatives': {}},
-                'poly_l_serine_bottles': {'poly_l_serine_bottles': {}},
-                'poly_l_serine_derivatives': {'poly_l_serine_derivatives': {}},
-                'fish_dishes': {'fish_dishes': {}}
-            }
-        print("Data loaded or initialized")
+        # Tables start out empty; data is filled in once loaded in the background
+        self.data_loaded.connect(self.apply_loaded_data)
         
-        print("Creating main widget...")
+        log.debug("Creating main widget...")
         # Create main widget and layout
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
         layout = QVBoxLayout(main_widget)
         
         # Create tab widget
-        print("Creating tab widget...")
+        log.debug("Creating tab widget...")
         tabs = QTabWidget()
         layout.addWidget(tabs)
         
         # Add tabs for different sections
         try:
-            print("Creating agarose tab...")
+            log.debug("Creating agarose tab...")
             agarose_tab = self.create_agarose_tab()
             tabs.addTab(agarose_tab, "Agarose Solutions")
             
-            print("Creating fish water tab...")
+            log.debug("Creating fish water tab...")
             fish_water_tab = self.create_fish_water_tab()
             tabs.addTab(fish_water_tab, "Fish Water")
             
-            print("Creating poly-l-serine tab...")
+            log.debug("Creating poly-l-serine tab...")
             pls_tab = self.create_poly_l_serine_tab()
             tabs.addTab(pls_tab, "Poly-L-Serine")
             
-            print("Creating fish dishes tab...")
+            log.debug("Creating fish dishes tab...")
             fish_dishes_tab = self.create_fish_dish_tab()
             tabs.addTab(fish_dishes_tab, "Fish Dishes")
             
-            print("All tabs created successfully")
+            log.debug("All tabs created successfully")
         except Exception as e:
-            print(f"Error creating tabs: {str(e)}")
+            log.error("Error creating tabs: %s", e)
             QMessageBox.warning(self, "Tab Creation Error", f"Error creating tabs: {str(e)}")
             raise
+        
+        # Then load data without blocking the event loop
+        log.debug("Loading data...")
+        self.load_data()
 
     def load_config(self):
         """Load configuration settings"""
         try:
-            with open('config.json', 'r') as f:
-                config = json.load(f)
-                self.material_data_dir = Path(config['remote_material_data_directory'])
-                self.dish_data_dir = Path(config['remote_dish_data_directory'])
+            config = _read_json('config.json')
+            self.material_data_dir = Path(config['remote_material_data_directory'])
+            self.dish_data_dir = Path(config['remote_dish_data_directory'])
         except FileNotFoundError:
             QMessageBox.critical(self, "Error", "config.json not found!")
             return False
         except KeyError:
             QMessageBox.critical(self, "Error", "Invalid config.json format!")
             return False
-        except json.JSONDecodeError:
+        except ValueError:
             QMessageBox.critical(self, "Error", "Invalid JSON in config.json!")
             return False
         except Exception as e:
@@ -467,115 +678,141 @@ class LabInventoryGUI(QMainWindow):
         
     def validate_data_structure(self):
         """Validate the data structure has all required keys"""
-        required_structure = {
-            'agarose_bottles': ['agarose_bottles'],
-            'agarose_solutions': ['agarose_solutions'],
-            'fish_water_sources': ['fish_water_batches'],
-            'fish_water_derivatives': ['fish_water_derivatives'],
-            'poly_l_serine_bottles': ['poly_l_serine_bottles'],
-            'poly_l_serine_derivatives': ['poly_l_serine_derivatives']
-        }
-        
-        for key, subkeys in required_structure.items():
-            if key not in self.data:
-                print(f"Missing top-level key: {key}")
-                self.data[key] = {}
-            
-            for subkey in subkeys:
-                if subkey not in self.data[key]:
-                    print(f"Missing subkey {subkey} in {key}")
-                    self.data[key][subkey] = {}
+        data = self.data
+        for key in DATA_CATEGORIES:
+            if key not in data:
+                log.warning("Missing top-level key: %s", key)
+                data[key] = {}
                     
         return True
 
     def load_data(self):
-        """Load all data files from remote directories"""
-        success = True
-        
-        # Load material files
-        material_files = {
-            'agarose_bottles': 'agarose_bottles.json',
-            'agarose_solutions': 'agarose_solutions.json',
-            'fish_water_sources': 'fish_water_sources.json',
-            'fish_water_derivatives': 'fish_water_derivatives.json',
-            'poly_l_serine_bottles': 'poly-l-serine_bottles.json',
-            'poly_l_serine_derivatives': 'poly-l-serine_derivatives.json'
-        }
-        
-        if not self.material_data_dir:
-            print("No material data directory configured")
-            success = False
-        else:
-            success &= self._load_category_files(material_files, self.material_data_dir)
+        """Start loading all data files from the remote directories on a pool thread
+        
+        The tabs stay disabled until the worker's result is applied by
+        apply_loaded_data on the UI thread.
+        """
+        self.centralWidget().setEnabled(False)
+        self.statusBar().showMessage("Loading data...")
+        worker = _LoadWorker(self.material_data_dir, self.dish_data_dir, self.data_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def apply_loaded_data(self, result):
+        """Install data loaded by _LoadWorker and fill the tables and dropdowns"""
+        data, dish_index, file_contents, errors, success = result
         
-        # Load fish dishes
-        try:
-            self.data['fish_dishes'] = self.load_fish_dishes()
-        except Exception as e:
-            print(f"Error loading fish dishes: {str(e)}")
-            self.data['fish_dishes'] = {'fish_dishes': {}}
-            success = False
+        # Report all failures together rather than one dialog per file
+        if errors:
+            QMessageBox.warning(
+                self,
+                "Data Loading Error",
+                "Error loading:\n" + "\n".join(errors.values()) + "\nStarting with empty datasets for these files."
+            )
+        if not success:
+            log.warning("Data loading incomplete, continuing with the data that loaded")
+        # Everything that loaded is kept; the placeholders for failed files
+        # must never be saved over them
+        self.data = data
+        self._failed_categories = set(errors)
+        self._material_file_contents = file_contents
+        self._dish_index = dish_index
+        self._id_counters.clear()
         
         # Validate and fix data structure
-        print("Validating data structure...")
+        log.debug("Validating data structure...")
         self.validate_data_structure()
+        self.invalidate_dish_rows()
+        log.debug("Data loaded or initialized")
         
-        return success
+        self.update_fw_batches()
+        self.update_fw_sources()
+        self.update_pls_bottles()
+        self.update_solutions_table()
+        self.update_fw_table()
+        self.update_pls_table()
+        self.update_dishes_table()
+        
+        self.statusBar().clearMessage()
+        self.centralWidget().setEnabled(True)
+                
+    def save_data(self, *categories):
+        """Save material data back to JSON files in the remote material directory
+        
+        Only the given categories are written, or all of them if none are given.
+        Fish dishes are not saved here; each dish is written to its own file by
+        save_fish_dish when it changes. Categories whose file failed to load are
+        never written.
+        """
+        categories = categories or tuple(MATERIAL_FILES)
+        # A category whose file failed to load only holds an empty placeholder,
+        # so writing it would wipe the file on the share
+        failed = [key for key in categories if key in self._failed_categories]
+        if failed:
+            filenames = ", ".join(MATERIAL_FILES[key][0] for key in failed)
+            log.error("Not saving %s: failed to load", filenames)
+            QMessageBox.critical(
+                self,
+                "Save Error",
+                f"Not saving {filenames} because it failed to load; saving would overwrite "
+                "it. Fix the file and restart to save changes to it."
+            )
+        file_dict = {key: MATERIAL_FILES[key] for key in categories if key not in self._failed_categories}
+        return self._save_category_data(file_dict, self.material_data_dir) and not failed
 
-    def _load_category_files(self, file_dict, directory):
-        """Helper function to load files from a specific directory"""
+    def _save_category_data(self, file_dict, directory):
+        """Helper function to save categories to files in a specific directory
+        
+        Each file holds exactly one category, so it is written straight from
+        self.data under the file's item key, together with any other top-level
+        keys the file had when it was loaded, without reading and merging the
+        existing file first. All files are written to temporary names and then
+        renamed into place; the rename keeps each file whole, so nothing is
+        fsynced and the writes are left to the OS write-back cache.
+        """
+        if not directory:
+            QMessageBox.critical(self, "Save Error", "No material data directory configured!")
+            return False
+            
+        try:
+            # Create the directory if it doesn't exist
+            directory.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            QMessageBox.critical(self, "Save Error", f"Error creating {directory}: {str(e)}")
+            return False
+            
         success = True
-        for key, filename in file_dict.items():
+        staged = []
+        for key, (filename, file_key) in file_dict.items():
             file_path = directory / filename
+            tmp_path = file_path.with_name(filename + '.tmp')
             try:
-                if file_path.exists():
-                    print(f"Loading {filename}...")
-                    with open(file_path, 'r') as f:
-                        self.data[key] = json.load(f)
-                else:
-                    print(f"File {filename} not found, using empty dict")
-                    self.data[key] = {}
+                contents = self._material_file_contents.get(key, {})
+                _write_json(tmp_path, {**contents, file_key: self.data.get(key, {})})
+                staged.append((tmp_path, file_path))
             except Exception as e:
-                print(f"Error loading {filename}: {str(e)}")
-                QMessageBox.warning(
-                    self,
-                    "Data Loading Error",
-                    f"Error loading {filename}: {str(e)}\nStarting with empty dataset."
-                )
-                self.data[key] = {}
+                log.error("Error saving %s: %s", filename, e)
+                QMessageBox.critical(self, "Save Error", f"Error saving {filename}: {str(e)}")
+                success = False
+                
+        # Swap the new files into place
+        for tmp_path, file_path in staged:
+            try:
+                os.replace(tmp_path, file_path)
+            except OSError as e:
+                log.error("Error saving %s: %s", file_path.name, e)
+                QMessageBox.critical(self, "Save Error", f"Error saving {file_path.name}: {str(e)}")
                 success = False
-        
-        return success
                 
-    def save_data(self):
-        """Save all data back to JSON files in appropriate remote directories"""
-        material_categories = {
-            'agarose_bottles', 'agarose_solutions', 'fish_water_sources', 
-            'fish_water_derivatives', 'poly_l_serine_bottles', 'poly_l_serine_derivatives'
-        }
-        dish_categories = {'fish_dishes'}
-        
-        success = True
-        
-        # Save material data
-        if not self._save_category_data(material_categories, self.material_data_dir):
-            success = False
-            
-        # Save dish data
-        if not self._save_category_data(dish_categories, self.dish_data_dir):
-            success = False
-            
         return success
 
     def safe_get_nested(self, dict_obj, *keys, default=None):
         """Safely get nested dictionary values"""
         try:
-            result = dict_obj
             for key in keys:
-                result = result[key]
-            return result if result is not None else default
+                dict_obj = dict_obj[key]
         except (KeyError, TypeError):
             return default
+        return default if dict_obj is None else dict_obj
     
     def create_agarose_tab(self):
         """Create the agarose solutions management tab"""
@@ -627,12 +864,12 @@ class LabInventoryGUI(QMainWindow):
         layout.addLayout(form_layout)
         
         # Solutions table
-        self.solutions_table = QTableWidget()
-        self.solutions_table.setColumnCount(7)
-        self.solutions_table.setHorizontalHeaderLabels([
+        self.solutions_model = TextTableModel([
             "Solution ID", "Date Prepared", "Concentration", "Volume (mL)",
             "Fish Water Batch", "Storage Location", "Expiration"
-        ])
+        ], self)
+        self.solutions_table = QTableView()
+        self.solutions_table.setModel(self.solutions_model)
         layout.addWidget(self.solutions_table)
         
         self.update_solutions_table()
@@ -746,12 +983,12 @@ class LabInventoryGUI(QMainWindow):
         layout.addWidget(table_header)
         
         # Batches table
-        self.fw_table = QTableWidget()
-        self.fw_table.setColumnCount(5)
-        self.fw_table.setHorizontalHeaderLabels([
+        self.fw_model = TextTableModel([
             "Batch ID", "Source Batch", "Date Prepared", 
             "Volume (mL)", "Storage Location"
-        ])
+        ], self)
+        self.fw_table = QTableView()
+        self.fw_table.setModel(self.fw_model)
         layout.addWidget(self.fw_table)
         
         self.update_fw_table()
@@ -790,12 +1027,12 @@ class LabInventoryGUI(QMainWindow):
         layout.addLayout(form_layout)
         
         # Aliquots table
-        self.pls_table = QTableWidget()
-        self.pls_table.setColumnCount(5)
-        self.pls_table.setHorizontalHeaderLabels([
+        self.pls_model = TextTableModel([
             "Aliquot ID", "Source Bottle", "Date Prepared",
             "Volume (mL)", "Storage Location"
-        ])
+        ], self)
+        self.pls_table = QTableView()
+        self.pls_table.setModel(self.pls_model)
         layout.addWidget(self.pls_table)
         
         self.update_pls_table()
@@ -804,88 +1041,93 @@ class LabInventoryGUI(QMainWindow):
     def update_fw_batches(self):
         """Update fish water batch dropdown"""
         self.fw_batch.clear()
-        batches = self.safe_get_nested(self.data, 'fish_water_sources', 'fish_water_batches', default={})
-        for batch_id in batches:
-            self.fw_batch.addItem(batch_id)
+        self.fw_batch.addItems(list(self.data.get('fish_water_sources', {})))
             
     def update_fw_sources(self):
         """Update fish water source batch dropdown"""
         self.fw_source_batch.clear()
-        batches = self.safe_get_nested(self.data, 'fish_water_sources', 'fish_water_batches', default={})
-        for batch_id in batches:
-            self.fw_source_batch.addItem(batch_id)
+        self.fw_source_batch.addItems(list(self.data.get('fish_water_sources', {})))
             
     def update_pls_bottles(self):
         """Update poly-l-serine bottle dropdown"""
         self.pls_bottle.clear()
-        bottles = self.safe_get_nested(self.data, 'poly_l_serine_bottles', 'poly_l_serine_bottles', default={})
-        for bottle_id in bottles:
-            self.pls_bottle.addItem(bottle_id)
+        self.pls_bottle.addItems(list(self.data.get('poly_l_serine_bottles', {})))
     
     def update_solutions_table(self):
         """Update the agarose solutions table"""
-        solutions = self.safe_get_nested(self.data, 'agarose_solutions', 'agarose_solutions', default={})
-        self.solutions_table.setRowCount(len(solutions))
-        
-        for i, (sol_id, sol_data) in enumerate(solutions.items()):
-            self.solutions_table.setItem(i, 0, QTableWidgetItem(sol_id))
-            self.solutions_table.setItem(i, 1, QTableWidgetItem(str(self.safe_get_nested(sol_data, 'date_prepared', default=''))))
-            self.solutions_table.setItem(i, 2, QTableWidgetItem(str(self.safe_get_nested(sol_data, 'concentration', default=''))))
-            self.solutions_table.setItem(i, 3, QTableWidgetItem(str(self.safe_get_nested(sol_data, 'volume_prepared_mL', default=''))))
-            self.solutions_table.setItem(i, 4, QTableWidgetItem(str(self.safe_get_nested(sol_data, 'fish_water_batch_id', default=''))))
-            self.solutions_table.setItem(i, 5, QTableWidgetItem(str(self.safe_get_nested(sol_data, 'storage', 'location', default=''))))
-            self.solutions_table.setItem(i, 6, QTableWidgetItem(str(self.safe_get_nested(sol_data, 'storage', 'expiration', default=''))))
+        self.solutions_model.set_rows(_table_rows(self.data.get('agarose_solutions', {}), _SOLUTION_COLUMNS))
     
     def update_fw_table(self):
         """Update the fish water table"""
-        batches = self.safe_get_nested(self.data, 'fish_water_derivatives', 'fish_water_derivatives', default={})
-        self.fw_table.setRowCount(len(batches))
-        
-        for i, (batch_id, batch_data) in enumerate(batches.items()):
-            self.fw_table.setItem(i, 0, QTableWidgetItem(batch_id))
-            self.fw_table.setItem(i, 1, QTableWidgetItem(str(self.safe_get_nested(batch_data, 'source_batch_id', default=''))))
-            self.fw_table.setItem(i, 2, QTableWidgetItem(str(self.safe_get_nested(batch_data, 'date_prepared', default=''))))
-            self.fw_table.setItem(i, 3, QTableWidgetItem(str(self.safe_get_nested(batch_data, 'volume_prepared_mL', default=''))))
-            self.fw_table.setItem(i, 4, QTableWidgetItem(str(self.safe_get_nested(batch_data, 'storage', 'location', default=''))))
+        self.fw_model.set_rows(_table_rows(self.data.get('fish_water_derivatives', {}), _FW_COLUMNS))
     
     def update_pls_table(self):
         """Update the poly-l-serine table"""
-        aliquots = self.safe_get_nested(self.data, 'poly_l_serine_derivatives', 'poly_l_serine_derivatives', default={})
-        self.pls_table.setRowCount(len(aliquots))
-        
-        for i, (aliquot_id, aliquot_data) in enumerate(aliquots.items()):
-            self.pls_table.setItem(i, 0, QTableWidgetItem(aliquot_id))
-            self.pls_table.setItem(i, 1, QTableWidgetItem(str(self.safe_get_nested(aliquot_data, 'source_bottle_id', default=''))))
-            self.pls_table.setItem(i, 2, QTableWidgetItem(str(self.safe_get_nested(aliquot_data, 'date_prepared', default=''))))
-            self.pls_table.setItem(i, 3, QTableWidgetItem(str(self.safe_get_nested(aliquot_data, 'volume_prepared', default=''))))
-            self.pls_table.setItem(i, 4, QTableWidgetItem(str(self.safe_get_nested(aliquot_data, 'storage', 'location', default=''))))
+        self.pls_model.set_rows(_table_rows(self.data.get('poly_l_serine_derivatives', {}), _PLS_COLUMNS))
+    
+    def mark_category_dirty(self, category):
+        """Queue the views showing a category for one refresh on the next event loop pass"""
+        if not self._dirty_categories:
+            QTimer.singleShot(0, self.refresh_dirty_views)
+        self._dirty_categories.add(category)
+    
+    def refresh_dirty_views(self):
+        """Refresh each view showing a changed category once, however many changes were queued"""
+        dirty, self._dirty_categories = self._dirty_categories, set()
+        updaters = {name for category in dirty for name in self.CATEGORY_VIEWS.get(category, ())}
+        for name in updaters:
+            getattr(self, name)()
+    
+    def _unique_item_id(self, items, base_id):
+        """Return base_id, or base_id with the next free numeric suffix if it's taken"""
+        if base_id not in items:
+            return base_id
+        
+        # Find next available ID, starting from the suffix handed out last
+        # time rather than from 1
+        i = self._id_counters.get(base_id, 1)
+        while f"{base_id}_{i}" in items:
+            i += 1
+        self._id_counters[base_id] = i
+        return f"{base_id}_{i}"
     
     def add_agarose_solution(self):
         """Add a new agarose solution"""
-        today = datetime.now().strftime("%Y%m%d")
-        solution_id = f"AGSOL_{today}"
-        
-        # Check if solution ID already exists
-        solutions = self.safe_get_nested(self.data, 'agarose_solutions', 'agarose_solutions', default={})
-        if solution_id in solutions:
-            # Find next available ID
-            i = 1
-            while f"{solution_id}_{i}" in solutions:
-                i += 1
-            solution_id = f"{solution_id}_{i}"
+        bottle_id = self.agarose_bottle_id.text().strip()
+        fw_batch_id = self.fw_batch.currentText()
+        concentration = self.concentration.value()
+        volume = self.volume.value()
+        
+        # Validate inputs before touching the inventory
+        if not bottle_id:
+            QMessageBox.warning(self, "Input Error", "Please enter an agarose bottle ID")
+            return
+            
+        if not fw_batch_id:
+            QMessageBox.warning(self, "Input Error", "Please select a fish water batch")
+            return
+            
+        if concentration <= 0 or volume <= 0:
+            QMessageBox.warning(self, "Input Error", "Concentration and volume must be greater than zero")
+            return
+        
+        today, expiration = _today_strings()
+        
+        # Fetch the solutions once for both the ID check and the insert
+        solutions = self.data.setdefault('agarose_solutions', {})
+        solution_id = self._unique_item_id(solutions, f"AGSOL_{today}")
         
         new_solution = {
-            "concentration": self.concentration.value(),
+            "concentration": concentration,
             "date_prepared": today,
             "prepared_by": "Lab Staff",  # Could add user input for this
-            "agarose_bottle_id": self.agarose_bottle_id.text(),
-            "fish_water_batch_id": self.fw_batch.currentText(),
-            "volume_prepared_mL": self.volume.value(),
+            "agarose_bottle_id": bottle_id,
+            "fish_water_batch_id": fw_batch_id,
+            "volume_prepared_mL": volume,
             "storage": {
                 "location": "2E.260-6-3",  # Could add input for this
                 "container": "incubator",
-                "expiration": (datetime.now().replace(year=datetime.now().year + 1)
-                             .strftime("%Y%m%d"))
+                "expiration": expiration
             },
             "quality_checks": {
                 "visual_inspection": "Clear, no particles"
@@ -893,12 +1135,9 @@ class LabInventoryGUI(QMainWindow):
             "notes": None
         }
         
-        if 'agarose_solutions' not in self.data:
-            self.data['agarose_solutions'] = {'agarose_solutions': {}}
-        
-        self.data['agarose_solutions']['agarose_solutions'][solution_id] = new_solution
-        self.save_data()
-        self.update_solutions_table()
+        solutions[solution_id] = new_solution
+        self.save_data('agarose_solutions')
+        self.data_changed.emit('agarose_solutions')
         
         # Clear inputs
         self.agarose_bottle_id.clear()
@@ -1013,12 +1252,12 @@ class LabInventoryGUI(QMainWindow):
         layout.addWidget(table_header)
         
         # Batches table
-        self.fw_table = QTableWidget()
-        self.fw_table.setColumnCount(5)
-        self.fw_table.setHorizontalHeaderLabels([
+        self.fw_model = TextTableModel([
             "Batch ID", "Source Batch", "Date Prepared", 
             "Volume (mL)", "Storage Location"
-        ])
+        ], self)
+        self.fw_table = QTableView()
+        self.fw_table.setModel(self.fw_model)
         layout.addWidget(self.fw_table)
         
         self.update_fw_table()
@@ -1048,7 +1287,7 @@ class LabInventoryGUI(QMainWindow):
             return
         
         # Check if batch ID already exists
-        existing_batches = self.safe_get_nested(self.data, 'fish_water_sources', 'fish_water_batches', default={})
+        existing_batches = self.data.get('fish_water_sources', {})
         if batch_id in existing_batches:
             QMessageBox.warning(self, "Input Error", f"Batch ID {batch_id} already exists")
             return
@@ -1060,16 +1299,12 @@ class LabInventoryGUI(QMainWindow):
             "notes": notes
         }
         
-        # Ensure data structure exists
-        if 'fish_water_sources' not in self.data:
-            self.data['fish_water_sources'] = {'fish_water_batches': {}}
-        
         # Add new batch
-        self.data['fish_water_sources']['fish_water_batches'][batch_id] = new_batch
+        self.data.setdefault('fish_water_sources', {})[batch_id] = new_batch
         
         # Save data and update UI
-        if self.save_data():
-            self.update_fw_sources()  # Update source batch dropdown
+        if self.save_data('fish_water_sources'):
+            self.data_changed.emit('fish_water_sources')  # Update source batch dropdowns
             QMessageBox.information(self, "Success", f"Added new source batch {batch_id}")
             
             # Clear inputs
@@ -1081,17 +1316,11 @@ class LabInventoryGUI(QMainWindow):
         
     def add_filtered_water(self):
         """Add a new filtered water batch"""
-        today = datetime.now().strftime("%Y%m%d")
-        batch_id = f"FW_FILTERED_{today}"
+        today = _today_str()
         
-        # Check if batch ID already exists
-        batches = self.safe_get_nested(self.data, 'fish_water_derivatives', 'fish_water_derivatives', default={})
-        if batch_id in batches:
-            # Find next available ID
-            i = 1
-            while f"{batch_id}_{i}" in batches:
-                i += 1
-            batch_id = f"{batch_id}_{i}"
+        # Fetch the batches once for both the ID check and the insert
+        batches = self.data.setdefault('fish_water_derivatives', {})
+        batch_id = self._unique_item_id(batches, f"FW_FILTERED_{today}")
         
         new_batch = {
             "source_batch_id": self.fw_source_batch.currentText(),
@@ -1112,12 +1341,9 @@ class LabInventoryGUI(QMainWindow):
             "notes": None
         }
         
-        if 'fish_water_derivatives' not in self.data:
-            self.data['fish_water_derivatives'] = {'fish_water_derivatives': {}}
-        
-        self.data['fish_water_derivatives']['fish_water_derivatives'][batch_id] = new_batch
-        self.save_data()
-        self.update_fw_table()
+        batches[batch_id] = new_batch
+        self.save_data('fish_water_derivatives')
+        self.data_changed.emit('fish_water_derivatives')
         
         # Clear inputs
         self.fw_volume.setValue(250)
@@ -1125,22 +1351,15 @@ class LabInventoryGUI(QMainWindow):
         
     def add_pls_aliquot(self):
         """Add a new poly-l-serine aliquot"""
-        today = datetime.now().strftime("%Y%m%d")
-        aliquot_id = f"PLS_ALIQUOT_{today}"
-        
-        # Check if aliquot ID already exists
-        aliquots = self.safe_get_nested(self.data, 'poly_l_serine_derivatives', 'poly_l_serine_derivatives', default={})
-        if aliquot_id in aliquots:
-            # Find next available ID
-            i = 1
-            while f"{aliquot_id}_{i}" in aliquots:
-                i += 1
-            aliquot_id = f"{aliquot_id}_{i}"
+        today = _today_str()
+        
+        # Fetch the aliquots once for both the ID check and the insert
+        aliquots = self.data.setdefault('poly_l_serine_derivatives', {})
+        aliquot_id = self._unique_item_id(aliquots, f"PLS_ALIQUOT_{today}")
         
         # Get expiration date from source bottle
         source_bottle = self.safe_get_nested(
-            self.data, 'poly_l_serine_bottles', 'poly_l_serine_bottles', 
-            self.pls_bottle.currentText(), default={}
+            self.data, 'poly_l_serine_bottles', self.pls_bottle.currentText(), default={}
         )
         expiration_date = self.safe_get_nested(source_bottle, 'expiration_date', default='')
         
@@ -1158,12 +1377,9 @@ class LabInventoryGUI(QMainWindow):
             "notes": None
         }
         
-        if 'poly_l_serine_derivatives' not in self.data:
-            self.data['poly_l_serine_derivatives'] = {'poly_l_serine_derivatives': {}}
-        
-        self.data['poly_l_serine_derivatives']['poly_l_serine_derivatives'][aliquot_id] = new_aliquot
-        self.save_data()
-        self.update_pls_table()
+        aliquots[aliquot_id] = new_aliquot
+        self.save_data('poly_l_serine_derivatives')
+        self.data_changed.emit('poly_l_serine_derivatives')
         
         # Clear inputs
         self.pls_volume.setValue(50)
@@ -1287,6 +1503,24 @@ class LabInventoryGUI(QMainWindow):
         self.fish_count.setValue(1)  # Default value
         form_layout.addWidget(self.fish_count, row, 3)
         
+        # Remember each field's starting value so clearing the form restores
+        # exactly these: (widget, setter, value)
+        self._dish_form_defaults = [
+            (self.cross_id, self.cross_id.setText, self.cross_id.text()),
+            (self.dish_number, self.dish_number.setValue, self.dish_number.value()),
+            (self.genotype, self.genotype.setText, self.genotype.text()),
+            (self.sex, self.sex.setCurrentText, self.sex.currentText()),
+            (self.species, self.species.setText, self.species.text()),
+            (self.responsible, self.responsible.setText, self.responsible.text()),
+            (self.parents, self.parents.setText, self.parents.text()),
+            (self.temperature, self.temperature.setValue, self.temperature.value()),
+            (self.room, self.room.setText, self.room.text()),
+            (self.light_duration, self.light_duration.setText, self.light_duration.text()),
+            (self.dawn_dusk, self.dawn_dusk.setText, self.dawn_dusk.text()),
+            (self.beaker_housing, self.beaker_housing.setChecked, self.beaker_housing.isChecked()),
+            (self.fish_count, self.fish_count.setValue, self.fish_count.value())
+        ]
+        
         # Add form to group box
         form_group.setLayout(form_layout)
         scroll_layout.addWidget(form_group)
@@ -1317,7 +1551,12 @@ class LabInventoryGUI(QMainWindow):
         layout.addLayout(visibility_layout)
         
         # Dishes table
-        self.dishes_table = QTableWidget()
+        self.dishes_model = TextTableModel([
+            "Dish ID", "Date Created", "Genotype",
+            "Responsible", "Status", "Location"
+        ], self)
+        self.dishes_table = QTableView()
+        self.dishes_table.setModel(self.dishes_model)
         layout.addWidget(self.dishes_table)
 
         # Setup the table with sorting functionality
@@ -1343,36 +1582,25 @@ class LabInventoryGUI(QMainWindow):
 
     def clear_fish_dish_form(self):
         """Clear all inputs in the fish dish form"""
-        self.cross_id.clear()
-        self.dish_number.setValue(1)
+        # Restore the starting values without emitting a change signal per field
+        for widget, setter, value in self._dish_form_defaults:
+            widget.blockSignals(True)
+            setter(value)
+            widget.blockSignals(False)
+        
+        # The date of fertilization defaults to today, whenever the form is cleared
         self.dof.setDate(QDate.currentDate())
-        self.genotype.clear()
-        self.sex.setCurrentText("unknown")
-        self.species.setText("Danio rerio")
-        self.responsible.setText("Jeremy Delahanty")
-        self.parents.clear()
-        self.temperature.setValue(28.5)
-        self.room.setText("2E.282")
-        self.light_duration.setText("14:10")
-        self.dawn_dusk.setText("8:00")
-        self.beaker_housing.setChecked(False)
-        self.fish_count.setValue(1)
 
     def setup_dish_table(self):
         """Setup the dish table with sorting and double-click handling"""
-        # Set up table columns
-        self.dishes_table.setColumnCount(6)
-        self.dishes_table.setHorizontalHeaderLabels([
-            "Dish ID", "Date Created", "Genotype",
-            "Responsible", "Status", "Location"
-        ])
-        
         # Customize table appearance and behavior
         self.dishes_table.setAlternatingRowColors(True)  # Makes rows easier to read
-        self.dishes_table.setSelectionBehavior(QTableWidget.SelectRows)  # Select entire rows
-        self.dishes_table.setSelectionMode(QTableWidget.SingleSelection)  # Allow only one selection
+        self.dishes_table.setSelectionBehavior(QTableView.SelectRows)  # Select entire rows
+        self.dishes_table.setSelectionMode(QTableView.SingleSelection)  # Allow only one selection
         self.dishes_table.verticalHeader().setVisible(True)  # Keep row numbers visible
-        self.dishes_table.setEditTriggers(QTableWidget.NoEditTriggers)  # Make cells read-only
+        # All rows are one line high, so the view never measures row contents
+        self.dishes_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.dishes_table.setEditTriggers(QTableView.NoEditTriggers)  # Make cells read-only
         
         # Make columns resize properly - using integers for resize modes
         header = self.dishes_table.horizontalHeader()
@@ -1390,16 +1618,16 @@ class LabInventoryGUI(QMainWindow):
         
         # Connect signals
         self.dishes_table.horizontalHeader().sectionClicked.connect(self.handle_header_click)
-        self.dishes_table.cellDoubleClicked.connect(self.handle_dish_cell_double_click)
+        self.dishes_table.doubleClicked.connect(self.handle_dish_cell_double_click)
 
     def handle_dish_double_click(self, row, column):
         """Handle double-click on a dish in the table"""
         try:
             # Get dish ID from the first column
-            dish_id = self.dishes_table.item(row, 0).text()
+            dish_id = self.dishes_model.row_values(row)[0]
             
-            # Get the dish data
-            dish_data = self.load_single_dish(dish_id)
+            # Make sure the dish exists before opening the dialog
+            dish_data = self.get_dish(dish_id)
             if not dish_data:
                 QMessageBox.warning(self, "Error", f"Could not load dish {dish_id}")
                 return
@@ -1422,10 +1650,10 @@ class LabInventoryGUI(QMainWindow):
             # Get quality check data
             check_data = dialog.get_data()
             
-            # Update the dish data
+            # Update the dish data; the write is queued, and flush_pending_writes
+            # reports whether it reached the file
             if self.update_dish_quality_check(dish_id, check_data):
-                # Success message (optional - might be annoying with multiple saves)
-                QMessageBox.information(self, "Success", "Quality check saved successfully")
+                self.statusBar().showMessage(f"Saving quality check for dish {dish_id}...")
             else:
                 QMessageBox.warning(self, "Error", "Failed to save quality check")
                 
@@ -1436,7 +1664,7 @@ class LabInventoryGUI(QMainWindow):
         """Add a new fish dish"""
         try:
             # Get today's date
-            today = datetime.now().strftime("%Y%m%d")
+            today = _today_str()
             
             # Generate dish ID
             dish_id = f"{self.cross_id.text()}_{self.dish_number.value()}"
@@ -1473,20 +1701,20 @@ class LabInventoryGUI(QMainWindow):
                 "termination_reason": None
             }
             
-            # Check if dish already exists
+            # Check if dish already exists, in memory first and then on the
+            # shared drive in case someone else has added it since we loaded
             dish_file = self.dish_data_dir / f"{dish_id}_{new_dish['dof']}.json"
-            if dish_file.exists():
+            if self.fish_dish_exists(dish_id) or dish_file.exists():
                 QMessageBox.warning(self, "Error", f"Dish {dish_id} already exists!")
                 return
             
             # Save the individual dish file
             if self.save_fish_dish(new_dish):
                 # Update the in-memory data structure
-                if 'fish_dishes' not in self.data:
-                    self.data['fish_dishes'] = {'fish_dishes': {}}
-                self.data['fish_dishes']['fish_dishes'][dish_id] = new_dish
+                self.data.setdefault('fish_dishes', {})[dish_id] = new_dish
+                self.invalidate_dish_rows(dish_id)
                 
-                self.update_dishes_table()
+                self.data_changed.emit('fish_dishes')
                 self.clear_fish_dish_form()
                 QMessageBox.information(self, "Success", f"Added new dish: {dish_id}")
             else:
@@ -1502,26 +1730,7 @@ class LabInventoryGUI(QMainWindow):
             return False
             
         try:
-            # Create dishes directory if it doesn't exist
-            self.dish_data_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Generate filename from dish_id and dof
-            dish_id = dish_data['dish_id']
-            
-            # Check if using old or new structure for dof
-            if 'dof' in dish_data:
-                dof = dish_data['dof']
-            else:
-                # Fall back to old structure if needed
-                dof = dish_data['metadata']['dof']
-                
-            filename = f"{dish_id}_{dof}.json"
-            file_path = self.dish_data_dir / filename
-            
-            # Save dish to file
-            with open(file_path, 'w') as f:
-                json.dump(dish_data, f, indent=2)
-                
+            self._write_fish_dish(dish_data)
             return True
                 
         except Exception as e:
@@ -1532,187 +1741,269 @@ class LabInventoryGUI(QMainWindow):
             )
             return False
 
-    def load_fish_dishes(self):
-        """Load all fish dishes from the directory"""
+    def _write_fish_dish(self, dish_data):
+        """Write a single fish dish to its own file, raising on failure instead of reporting it"""
         if not self.dish_data_dir:
-            return {'fish_dishes': {}}
+            raise ValueError("No dish data directory configured")
             
-        dishes = {}
-        try:
-            # Load each dish file in the directory
-            for dish_file in self.dish_data_dir.glob("*.json"):
-                with open(dish_file, 'r') as f:
-                    dish_data = json.load(f)
-                    dish_id = dish_data['dish_id']
-                    dishes[dish_id] = dish_data
-                    
-            return {'fish_dishes': dishes}
+        # Create dishes directory if it doesn't exist
+        self.dish_data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Generate filename from dish_id and dof
+        dish_id = dish_data['dish_id']
+        
+        # Check if using old or new structure for dof
+        if 'dof' in dish_data:
+            dof = dish_data['dof']
+        else:
+            # Fall back to old structure if needed
+            dof = dish_data['metadata']['dof']
             
-        except Exception as e:
-            print(f"Error loading dishes: {str(e)}")
-            return {'fish_dishes': {}}
+        filename = f"{dish_id}_{dof}.json"
+        file_path = self.dish_data_dir / filename
+        
+        # Save dish to file
+        _replace_json(file_path, dish_data)
+        self._dish_index[dish_id] = (file_path, file_path.stat().st_mtime_ns)
+
+    def fish_dish_exists(self, dish_id):
+        """Check whether a dish ID is already among the loaded dishes"""
+        return dish_id in self.data.get('fish_dishes', {})
+
+    def get_dish(self, dish_id):
+        """Return the loaded data for a dish, reading its file only if it isn't in memory yet"""
+        dishes = self.data.get('fish_dishes', {})
+        dish_data = dishes.get(dish_id)
+        if dish_data is None:
+            dish_data = self.load_single_dish(dish_id)
+        return dish_data
+
+    def refresh_dish_index(self):
+        """Re-list the dish directory to pick up dish files added or removed outside this session
+        
+        Files that are already indexed keep their entry, which is keyed on the
+        dish_id inside the file as the loader read it. Only new files are
+        indexed under the dish_id in their name, until they are read.
+        """
+        listed = _scan_dish_files(self.dish_data_dir)
+        listed_files = {dish_file for _, dish_file in listed}
+        index = {
+            dish_id: known_file for dish_id, known_file in self._dish_index.items()
+            if known_file[0] in listed_files
+        }
+        known_files = {known_file[0] for known_file in index.values()}
+        for dish_id, dish_file in listed:
+            if dish_file not in known_files:
+                index.setdefault(dish_id, (dish_file, None))
+        self._dish_index = index
 
     def load_single_dish(self, dish_id):
-        """Load a single dish file"""
+        """Load a single dish file
+        
+        The file is found through the dish index rather than a directory scan.
+        If it hasn't been modified since this session last read or wrote it, the
+        loaded dish data is returned without re-reading the file.
+        """
         try:
-            # Find the dish file
-            dish_files = list(self.dish_data_dir.glob(f"{dish_id}_*.json"))
-            if not dish_files:
+            known_file = self._dish_index.get(dish_id)
+            if known_file is None:
+                # Possibly added by another instance since the dishes were loaded
+                self.refresh_dish_index()
+                known_file = self._dish_index.get(dish_id)
+                if known_file is None:
+                    return None
+            file_path, known_mtime_ns = known_file
+            
+            try:
+                mtime_ns = file_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                del self._dish_index[dish_id]
                 return None
                 
-            # Load the dish data
-            with open(dish_files[0], 'r') as f:
-                return json.load(f)
+            dishes = self.data.setdefault('fish_dishes', {})
+            if mtime_ns == known_mtime_ns and dish_id in dishes:
+                return dishes[dish_id]
+                
+            # Load the dish data, noting the mtime first so a concurrent change
+            # is picked up on the next load. The in-memory dish is replaced
+            # along with the mtime, so a matching mtime always means the loaded
+            # dish is the file's current contents.
+            dish_data = _read_json(file_path)
+            dishes[dish_id] = dish_data
+            self._dish_index[dish_id] = (file_path, mtime_ns)
+            self.invalidate_dish_rows(dish_id)
+            self.data_changed.emit('fish_dishes')
+            return dish_data
                 
         except Exception as e:
-            print(f"Error loading dish {dish_id}: {str(e)}")
+            log.error("Error loading dish %s: %s", dish_id, e)
             return None
 
+    def patch_fish_dish(self, dish_id, changes, defer=False):
+        """Apply changes to a stored dish and save it
+        
+        Dict values in `changes` are merged into the dish's existing dict (e.g. a
+        new entry for 'quality_checks'); any other value replaces the existing one.
+        With defer=True the write is queued and coalesced with other updates to the
+        same dish (see queue_fish_dish_save).
+        Returns the updated dish data, or None if the dish couldn't be loaded or saved.
+        """
+        # Load current dish data, including any update that hasn't been written yet
+        current_data = self._pending_dish_writes.get(dish_id) or self.load_single_dish(dish_id)
+        if not current_data:
+            return None
+        
+        # Build the updated dish as a new dict; the current one may be the
+        # loaded dish shown in the table, which must stay as-is if saving fails
+        dish_data = dict(current_data)
+        for key, value in changes.items():
+            current = dish_data.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                dish_data[key] = {**current, **value}
+            else:
+                dish_data[key] = value
+        
+        if defer:
+            self.queue_fish_dish_save(dish_data)
+        elif self.save_fish_dish(dish_data):
+            # This write already includes any queued update for the dish
+            self._pending_dish_writes.pop(dish_id, None)
+        else:
+            return None
+        
+        # Update in-memory data
+        self.data['fish_dishes'][dish_id] = dish_data
+        self.invalidate_dish_rows(dish_id)
+        
+        return dish_data
+
+    def queue_fish_dish_save(self, dish_data):
+        """Save a dish after a short delay, coalescing repeated updates into one write"""
+        self._pending_dish_writes[dish_data['dish_id']] = dish_data
+        # Restart the countdown so a burst of updates ends in a single write
+        self._dish_write_timer.start()
+
+    def flush_pending_writes(self):
+        """Write all queued dish updates to disk and report the outcome
+        
+        Updates that fail to write stay queued, so they are retried with the
+        next flush instead of only existing in memory. All failures are
+        reported together in a single dialog.
+        """
+        self._dish_write_timer.stop()
+        pending, self._pending_dish_writes = self._pending_dish_writes, {}
+        if not pending:
+            return True
+        
+        failed = []
+        for dish_id, dish_data in pending.items():
+            try:
+                self._write_fish_dish(dish_data)
+            except Exception as e:
+                log.error("Error saving dish %s: %s", dish_id, e)
+                failed.append(f"{dish_id}: {str(e)}")
+                # Don't replace an update queued for the dish in the meantime
+                self._pending_dish_writes.setdefault(dish_id, dish_data)
+                
+        if failed:
+            self.statusBar().clearMessage()
+            QMessageBox.critical(
+                self,
+                "Save Error",
+                "Error saving dish updates:\n" + "\n".join(failed) +
+                "\nThey are kept and will be retried with the next save."
+            )
+            return False
+        self.statusBar().showMessage(f"Saved dish {', '.join(pending)}", 5000)
+        return True
+
     def update_dish_quality_check(self, dish_id, check_data):
         """Update the quality checks for a dish"""
         try:
-            # Load current dish data
-            dish_data = self.load_single_dish(dish_id)
-            if not dish_data:
-                return False
-                
             # Add new quality check
             check_time = check_data['check_time']
-            dish_data['quality_checks'][check_time] = check_data
-            
-            # Save updated dish data
-            # Check if using old or new structure for dof
-            if 'dof' in dish_data:
-                dof = dish_data['dof']
-            else:
-                # Fall back to old structure if needed
-                dof = dish_data['metadata']['dof']
-            
-            file_path = self.dish_data_dir / f"{dish_id}_{dof}.json"
-            
-            with open(file_path, 'w') as f:
-                json.dump(dish_data, f, indent=2)
-                
-            # Update in-memory data
-            self.data['fish_dishes']['fish_dishes'][dish_id] = dish_data
-            
-            return True
+            changes = {'quality_checks': {check_time: check_data}}
+            return self.patch_fish_dish(dish_id, changes, defer=True) is not None
         
         except Exception as e:
-            print(f"Error updating dish {dish_id}: {str(e)}")
+            log.error("Error updating dish %s: %s", dish_id, e)
             return False
 
+    def invalidate_dish_rows(self, dish_id=None):
+        """Drop cached dish table rows after the fish dish data changes
+        
+        Pass the ID of a single changed dish to keep the column values cached
+        for all the others.
+        """
+        self._dish_rows_cache.clear()
+        if dish_id is None:
+            self._dish_values_cache.clear()
+        else:
+            self._dish_values_cache.pop(dish_id, None)
+
     def update_dishes_table(self):
         """Update the fish dishes table with sorted entries"""
-        dishes = self.safe_get_nested(self.data, 'fish_dishes', 'fish_dishes', default={})
-        
-        # Filter dishes based on status if checkbox is unchecked
-        if not self.show_inactive.isChecked():
-            dishes = {k: v for k, v in dishes.items() if v.get('status', 'active') == 'active'}
-        
-        # Convert to list for sorting
-        dish_list = list(dishes.items())
+        show_inactive = self.show_inactive.isChecked()
         
         # Sort the dishes by dish_id (default sorting)
         # You can change the sort key based on the current sort column and order
         sort_column = self.dishes_sort_column if hasattr(self, 'dishes_sort_column') else 0
         sort_order = self.dishes_sort_order if hasattr(self, 'dishes_sort_order') else Qt.AscendingOrder
         
-        # Define sort key functions for different columns
-        def get_sort_key(item, col):
-            dish_id, dish_data = item
-            if col == 0:  # Dish ID
-                # Split the dish_id by underscore and further split by dots if needed
-                # This makes sorting work correctly for IDs like "14781_1", "14781_10"
-                parts = dish_id.split('_')
-                if len(parts) == 2:
-                    try:
-                        main_id = parts[0]
-                        # Handle sub-IDs that might be numeric
-                        sub_id = parts[1]
-                        try:
-                            # Try to convert sub_id to integer for numeric sorting
-                            return (main_id, int(sub_id))
-                        except ValueError:
-                            # If sub_id is not numeric, use string sorting
-                            return (main_id, sub_id)
-                    except (IndexError, ValueError):
-                        pass
-                # Fallback to string sorting
-                return dish_id
-            elif col == 1:  # Date created
-                return self.safe_get_nested(dish_data, 'date_created', default='')
-            elif col == 2:  # Genotype
-                # Check if this is the new flattened structure or old nested structure
-                genotype = self.safe_get_nested(dish_data, 'genotype', default=None)
-                if genotype is None:
-                    # Try old structure
-                    genotype = self.safe_get_nested(dish_data, 'metadata', 'genotype', default='')
-                return genotype
-            elif col == 3:  # Responsible
-                # Check if this is the new flattened structure or old nested structure
-                responsible = self.safe_get_nested(dish_data, 'responsible', default=None)
-                if responsible is None:
-                    # Try old structure
-                    responsible = self.safe_get_nested(dish_data, 'metadata', 'responsible', default='')
-                return responsible
-            elif col == 4:  # Status
-                return self.safe_get_nested(dish_data, 'status', default='')
-            elif col == 5:  # Location
-                # Check if this is the new flattened structure or old nested structure
-                room = self.safe_get_nested(dish_data, 'enclosure', 'room', default=None)
-                if room is None:
-                    # Try old structure
-                    room = self.safe_get_nested(dish_data, 'metadata', 'enclosure', 'room', default='')
-                return room
-            else:
-                return dish_id
+        # Reuse the previous filter/sort result if the dishes haven't changed since
+        cache_key = (show_inactive, sort_column, sort_order)
+        dish_list = self._dish_rows_cache.get(cache_key)
+        if dish_list is None:
+            dish_list = self._sorted_dish_rows(show_inactive, sort_column, sort_order)
+            self._dish_rows_cache[cache_key] = dish_list
+        
+        # Fill the table with the filtered, sorted rows
+        dish_values = self._dish_values
+        self.dishes_model.set_rows([dish_values(*item) for item in dish_list])
+
+    def _sorted_dish_rows(self, show_inactive, sort_column, sort_order):
+        """Filter and sort the fish dishes into a list of (dish_id, dish_data) pairs"""
+        dishes = self.data.get('fish_dishes', {})
+
+        # Filter dishes based on status if checkbox is unchecked, straight into
+        # the list that gets sorted (entries reference the loaded dish dicts)
+        if show_inactive:
+            dish_list = list(dishes.items())
+        else:
+            dish_list = [(k, v) for k, v in dishes.items() if v.get('status', 'active') == 'active']
+
+        # Pick the sort key once rather than branching on the column per item
+        if sort_column == 0:  # Dish ID
+            sort_key = lambda item: _dish_id_sort_key(item[0])
+        elif sort_column <= 5:  # Date created, genotype, responsible, status, location
+            dish_values = self._dish_values
+            sort_key = lambda item: dish_values(*item)[sort_column]
+        else:
+            sort_key = itemgetter(0)
         
         # Sort the dishes
-        dish_list.sort(key=lambda item: get_sort_key(item, sort_column), 
-                    reverse=(sort_order == Qt.DescendingOrder))
-        
-        # Set row count AFTER filtering
-        self.dishes_table.setRowCount(len(dish_list))
-        
-        # Populate the table with sorted data
-        for i, (dish_id, dish_data) in enumerate(dish_list):
-            self.dishes_table.setItem(i, 0, QTableWidgetItem(dish_id))
-            self.dishes_table.setItem(i, 1, QTableWidgetItem(
-                str(self.safe_get_nested(dish_data, 'date_created', default=''))
-            ))
-            
-            # Handle genotype - check for both old and new structure
-            genotype = self.safe_get_nested(dish_data, 'genotype', default=None)
-            if genotype is None:
-                # Try old structure
-                genotype = self.safe_get_nested(dish_data, 'metadata', 'genotype', default='')
-            self.dishes_table.setItem(i, 2, QTableWidgetItem(str(genotype)))
-            
-            # Handle responsible - check for both old and new structure
-            responsible = self.safe_get_nested(dish_data, 'responsible', default=None)
-            if responsible is None:
-                # Try old structure
-                responsible = self.safe_get_nested(dish_data, 'metadata', 'responsible', default='')
-            self.dishes_table.setItem(i, 3, QTableWidgetItem(str(responsible)))
-            
-            # Status is the same in both structures
-            self.dishes_table.setItem(i, 4, QTableWidgetItem(
-                str(self.safe_get_nested(dish_data, 'status', default=''))
-            ))
-            
-            # Handle room - check for both old and new structure
-            room = self.safe_get_nested(dish_data, 'enclosure', 'room', default=None)
-            if room is None:
-                # Try old structure
-                room = self.safe_get_nested(dish_data, 'metadata', 'enclosure', 'room', default='')
-            self.dishes_table.setItem(i, 5, QTableWidgetItem(str(room)))
-
-    def handle_dish_cell_double_click(self, row, column):
+        dish_list.sort(key=sort_key, reverse=(sort_order == Qt.DescendingOrder))
+        return dish_list
+
+    def _dish_values(self, dish_id, dish_data):
+        """Return a dish's table column values as text, reading the old or new structure"""
+        values = self._dish_values_cache.get(dish_id)
+        if values is not None:
+            return values
+        
+        values = (dish_id, *[str(get(dish_data)) for get in _DISH_COLUMN_GETTERS])
+        self._dish_values_cache[dish_id] = values
+        return values
+
+    def handle_dish_cell_double_click(self, index):
         """Handle double-click on dish table cells"""
+        if not index.isValid():
+            return
         try:
+            row, column = index.row(), index.column()
+            
             # Get dish ID from the first column
-            dish_id = self.dishes_table.item(row, 0).text()
+            dish_id = self.dishes_model.row_values(row)[0]
             
             # If clicking the status column
             if column == 4:  # Status column
@@ -1727,8 +2018,8 @@ class LabInventoryGUI(QMainWindow):
     def show_termination_dialog(self, dish_id):
         """Show dialog to update dish status"""
         try:
-            # Load current dish data
-            dish_data = self.load_single_dish(dish_id)
+            # Current dish data to fill in the dialog
+            dish_data = self.get_dish(dish_id)
             if not dish_data:
                 QMessageBox.warning(self, "Error", f"Could not load dish {dish_id}")
                 return
@@ -1747,14 +2038,9 @@ class LabInventoryGUI(QMainWindow):
                 # Get updated data
                 update_data = dialog.get_data()
                 
-                # Update dish data
-                dish_data.update(update_data)
-                
                 # Save changes
-                if self.save_fish_dish(dish_data):
-                    # Update in-memory data
-                    self.data['fish_dishes']['fish_dishes'][dish_id] = dish_data
-                    self.update_dishes_table()
+                if self.patch_fish_dish(dish_id, update_data):
+                    self.data_changed.emit('fish_dishes')
                     QMessageBox.information(self, "Success", "Dish status updated successfully")
                 else:
                     QMessageBox.warning(self, "Error", "Failed to save dish status update")
@@ -1763,10 +2049,17 @@ class LabInventoryGUI(QMainWindow):
             QMessageBox.critical(self, "Error", f"Error updating dish status: {str(e)}")
 
 def main():
+    # Startup progress is only logged with METAZEBROBOT_DEBUG=1
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("METAZEBROBOT_DEBUG") == "1" else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s"
+    )
     app = QApplication(sys.argv)
     window = LabInventoryGUI()
     window.show()
     sys.exit(app.exec())
 
+# Run as a module so the package-relative imports resolve:
+#     python -m metazebrobot.main_window
 if __name__ == '__main__':
     main()
@@ -0,0 +1,43 @@
+from PySide6.QtCore import Qt, QAbstractTableModel
+
+class TextTableModel(QAbstractTableModel):
+    """Read-only table model over rows of preformatted column text
+
+    The view only asks for the cells it shows, so refreshing the table is a
+    single model reset rather than one item per cell.
+    """
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Replace all rows; each row is a sequence of strings, one per column"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_values(self, row):
+        """Return the column text of a row"""
+        return self._rows[row]
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Only text is provided; every other role falls back to the view's defaults
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
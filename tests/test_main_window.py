@@ -0,0 +1,117 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from metazebrobot import main_window
+
+
+@pytest.fixture
+def dish_dir(tmp_path, monkeypatch):
+    """A dish directory with two dish files, and an empty local cache directory"""
+    monkeypatch.setattr(main_window, "DISH_CACHE_DIR", tmp_path / "cache")
+    directory = tmp_path / "dishes"
+    directory.mkdir()
+    for dish_id in ("100_1", "100_2"):
+        (directory / f"{dish_id}_20250101.json").write_text(
+            json.dumps({"dish_id": dish_id, "genotype": f"g{dish_id}"})
+        )
+    return directory
+
+
+def _write_cache(dish_dir, contents):
+    cache_file = main_window._dish_cache_file(dish_dir)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps(contents))
+    return cache_file
+
+
+@pytest.mark.parametrize("contents", [[1, 2], None, 42, {"100_1_20250101.json": [0, 0, {}]}])
+def test_load_fish_dishes_ignores_corrupt_cache(dish_dir, contents):
+    cache_file = _write_cache(dish_dir, contents)
+
+    dishes, index = main_window._load_fish_dishes(dish_dir)
+
+    assert sorted(dishes) == ["100_1", "100_2"]
+    assert sorted(index) == ["100_1", "100_2"]
+    # The unusable cache is replaced by a current one
+    assert json.loads(cache_file.read_text())["version"] == main_window.DISH_CACHE_VERSION
+
+
+def test_load_fish_dishes_rereads_malformed_cache_entry(dish_dir):
+    main_window._load_fish_dishes(dish_dir)
+    cache_file = main_window._dish_cache_file(dish_dir)
+    cached = json.loads(cache_file.read_text())
+    cached["files"]["100_1_20250101.json"] = ["not", "an entry"]
+    cached["files"]["100_2_20250101.json"][2] = "not a dish"
+    cache_file.write_text(json.dumps(cached))
+
+    dishes, _ = main_window._load_fish_dishes(dish_dir)
+
+    assert dishes["100_1"]["genotype"] == "g100_1"
+    assert dishes["100_2"]["genotype"] == "g100_2"
+    entries = main_window._valid_cache_entries(json.loads(cache_file.read_text()))
+    assert sorted(entries) == ["100_1_20250101.json", "100_2_20250101.json"]
+
+
+def test_load_fish_dishes_uses_valid_cache_entry(dish_dir):
+    main_window._load_fish_dishes(dish_dir)
+    cache_file = main_window._dish_cache_file(dish_dir)
+    cached = json.loads(cache_file.read_text())
+    # A current entry is returned as cached, without reading the file again
+    cached["files"]["100_1_20250101.json"][2]["genotype"] = "from cache"
+    cache_file.write_text(json.dumps(cached))
+
+    dishes, _ = main_window._load_fish_dishes(dish_dir)
+
+    assert dishes["100_1"]["genotype"] == "from cache"
+
+
+@pytest.mark.parametrize("dish_data, expected", [
+    ({"date_created": "20250101", "genotype": "g", "responsible": "r", "status": "active",
+      "enclosure": {"room": "2E"}}, ["20250101", "g", "r", "active", "2E"]),
+    # Old structure, with the fields under metadata
+    ({"metadata": {"genotype": "g", "responsible": "r", "enclosure": {"room": "X"}}},
+     ["", "g", "r", "", "X"]),
+    # Null and falsy values
+    ({"date_created": None, "genotype": 0, "status": None, "enclosure": {"room": None}},
+     ["", 0, "", "", ""]),
+    # Levels that aren't dicts
+    ({"metadata": "old", "enclosure": ["2E"]}, ["", "", "", "", ""]),
+])
+def test_dish_column_getters(dish_data, expected):
+    assert [get(dish_data) for get in main_window._DISH_COLUMN_GETTERS] == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.015, "0.015"),
+    (0.019999999999, "0.02"),
+    (0.1 + 0.2, "0.3"),
+    (100.0, "100"),
+    (250.5, "250.5"),
+    (1500000.0, "1500000"),
+    (1234567.0, "1234570"),
+    (0.00005, "0.00005"),
+    (0.000012345678, "0.0000123457"),
+    (2, "2"),
+    ("x", "x"),
+])
+def test_format_number(value, expected):
+    assert main_window._format_number(value) == expected
+
+
+def test_refresh_dish_index_keeps_loaded_keys(dish_dir):
+    # A file whose name and contents disagree is indexed by the loader under
+    # the dish_id inside it
+    mismatched = dish_dir / "100_9_20250101.json"
+    mismatched.write_text(json.dumps({"dish_id": "100_3"}))
+    _, index = main_window._load_fish_dishes(dish_dir)
+    (dish_dir / "100_2_20250101.json").unlink()
+    (dish_dir / "200_1_20250101.json").write_text(json.dumps({"dish_id": "200_1"}))
+    window = SimpleNamespace(dish_data_dir=dish_dir, _dish_index=index)
+
+    main_window.LabInventoryGUI.refresh_dish_index(window)
+
+    assert sorted(window._dish_index) == ["100_1", "100_3", "200_1"]
+    assert window._dish_index["100_3"] == index["100_3"]
+    assert window._dish_index["200_1"] == (dish_dir / "200_1_20250101.json", None)